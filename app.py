@@ -1,100 +1,377 @@
 """Flask web interface for Patent Relevance Scoring Engine."""
-import os
 import asyncio
-import json
-import base64
+import time
+import hashlib
+import logging
+import queue
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache, partial
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from pathlib import Path
-from threading import Thread
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from threading import BoundedSemaphore, Lock, RLock, Thread
+from logging.handlers import QueueHandler, QueueListener
+import msgspec
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-from werkzeug.utils import secure_filename
-from pipeline import PatentRelevancePipeline
-from models import InventionInput
+from dotenv import load_dotenv
+from openai import AsyncOpenAI
+from base_agent import create_openai_client
+from pipeline import Final, PatentRelevancePipeline
+from models import EvaluateRequest, InventionInput
 from hooks import PipelineHooks
+from semantic_cache import SemanticCache
 
 # Initialize Flask app
 app = Flask(__name__, template_folder='templates', static_folder='static')
 CORS(app)
 
 # Configuration
-UPLOAD_FOLDER = os.path.join(os.path.dirname(__file__), 'uploads')
-ALLOWED_EXTENSIONS = {'txt', 'pdf', 'png', 'jpg', 'jpeg', 'gif'}
+BASE_DIR = Path(__file__).resolve().parent
+UPLOAD_FOLDER = BASE_DIR / 'uploads'
+ALLOWED_EXTENSIONS = frozenset({'txt', 'pdf', 'png', 'jpg', 'jpeg', 'gif'})
 MAX_CONTENT_LENGTH = 50 * 1024 * 1024  # 50MB max file size
+MAX_PROGRESS_EVENTS = 500  # Progress messages retained per session
+IMAGE_PREVIEW_CHARS = 100  # Base64 characters kept per uploaded image
+SESSION_TTL_SECONDS = 3600  # Finished sessions are evicted after this long
+SSE_KEEPALIVE_SECONDS = 15  # Idle interval before a stream sends a keepalive
+MAX_SSE_STREAMS = 4  # Open streams each hold a worker thread; extra clients get 503 and poll
+FINISHED_STATUSES = ("completed", "failed")
+RESULT_CACHE_SIZE = 128  # Results kept for repeat submissions (0 disables)
+SEMANTIC_CACHE_THRESHOLD = 0.92  # Cosine similarity for reusing agent outputs
 
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+app.config['UPLOAD_FOLDER'] = str(UPLOAD_FOLDER)
 app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 
 # Create upload folder if it doesn't exist
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+UPLOAD_FOLDER.mkdir(exist_ok=True)
+
+# Pipeline hook logs go through a queue, so the stream handler's I/O runs on a
+# listener thread. QueueHandler.prepare() still formats each record in the
+# calling thread before it is queued.
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+hooks_logger = logging.getLogger("hooks")
+hooks_logger.addHandler(QueueHandler(_log_queue))
+hooks_logger.setLevel(logging.INFO)
+hooks_logger.propagate = False
+_log_listener.start()
+
+# Shared encoder/decoder for API payloads (avoids per-request setup)
+_json_encoder = msgspec.json.Encoder()
+_evaluate_request_decoder = msgspec.json.Decoder(EvaluateRequest)
+
+
+class MsgspecJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by msgspec, so jsonify() skips the stdlib encoder.
+    
+    Types msgspec can't encode natively go through Flask's usual ``default``
+    hook. Keys are emitted in insertion order, as with json_response().
+    """
+    
+    sort_keys = False
+    
+    def __init__(self, app):
+        super().__init__(app)
+        self._encoder = msgspec.json.Encoder(enc_hook=self.default)
+    
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._encoder.encode(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return msgspec.json.decode(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = self._encoder.encode(obj)
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            body = msgspec.json.format(body, indent=2)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+
+app.json = MsgspecJSONProvider(app)
+
+
+def json_response(data, status=200):
+    """Encode data with msgspec and wrap it in a JSON response."""
+    return Response(_json_encoder.encode(data), status=status, mimetype='application/json')
+
+
+def format_timestamp_ns(timestamp_ns: int) -> str:
+    """Format a time.time_ns() value as a local ISO-8601 string."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
+@dataclass(slots=True)
+class ProgressEvent:
+    """A single progress message emitted during an evaluation."""
+    message: str
+    level: str
+    timestamp_ns: int
+
+
+@dataclass(slots=True)
+class Session:
+    """State of a single evaluation session."""
+    status: str = "pending"
+    progress: Deque[ProgressEvent] = field(
+        default_factory=lambda: deque(maxlen=MAX_PROGRESS_EVENTS)
+    )
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    start_time_ns: int = field(default_factory=time.time_ns)
+    agents: List[Dict[str, Any]] = field(default_factory=list)  # Track individual agent outputs
+    current_agent: Optional[str] = None
+    subscribers: List[queue.SimpleQueue] = field(default_factory=list)  # Open /api/stream queues
+    status_cache: Optional[Tuple[bytes, str]] = None  # Encoded /api/status body and its ETag
 
 
 class SessionManager:
-    """Manages evaluation sessions."""
+    """Manages evaluation sessions.
+    
+    Sessions are written from evaluation workers and read from request
+    handlers, so every access goes through a lock. Finished sessions are
+    evicted once they are older than the TTL. Every change is also pushed
+    to the session's stream subscribers as an ``(event, data)`` pair, and
+    drops the session's cached status body.
+    """
     
-    def __init__(self):
-        self.sessions = {}
+    def __init__(self, ttl_seconds: float = SESSION_TTL_SECONDS):
+        self.sessions: Dict[str, Session] = {}
         self.current_session_id = None
+        self._lock = RLock()
+        self._ttl_seconds = ttl_seconds
     
     def create_session(self, session_id):
         """Create a new session."""
-        self.sessions[session_id] = {
-            "status": "pending",
-            "progress": [],
-            "result": None,
-            "error": None,
-            "start_time": datetime.now().isoformat(),
-            "agents": [],  # Track individual agent outputs
-            "current_agent": None,
+        with self._lock:
+            self._evict_expired()
+            self.sessions[session_id] = Session()
+            self.current_session_id = session_id
+    
+    def _evict_expired(self):
+        """Drop finished sessions older than the TTL (caller holds the lock)."""
+        cutoff_ns = time.time_ns() - int(self._ttl_seconds * 1e9)
+        expired = [
+            session_id for session_id, session in self.sessions.items()
+            if session.start_time_ns < cutoff_ns and session.status in FINISHED_STATUSES
+        ]
+        for session_id in expired:
+            del self.sessions[session_id]
+    
+    @staticmethod
+    def _publish(session, event, data):
+        """Push an event to the session's stream subscribers (caller holds the lock)."""
+        session.status_cache = None
+        for subscriber in session.subscribers:
+            subscriber.put((event, data))
+    
+    @staticmethod
+    def _agents_payload(session, agents=None):
+        """Agent outputs (all by default) and current agent, ready for JSON (caller holds the lock)."""
+        return {
+            "agents": [
+                {**agent, "timestamp": format_timestamp_ns(agent["timestamp"])}
+                for agent in (session.agents if agents is None else agents)
+            ],
+            "current_agent": session.current_agent,
         }
-        self.current_session_id = session_id
     
     def add_agent_output(self, session_id, agent_name, output_data):
         """Add agent output to session."""
-        if session_id in self.sessions:
-            self.sessions[session_id]["agents"].append({
-                "name": agent_name,
-                "output": output_data,
-                "timestamp": datetime.now().isoformat(),
-                "status": "completed"
-            })
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session is not None:
+                agent = {
+                    "name": agent_name,
+                    "output": output_data,
+                    "timestamp": time.time_ns(),  # Formatted in get_status
+                    "status": "completed"
+                }
+                session.agents.append(agent)
+                # Subscribers already hold the earlier entries; send only the new one
+                self._publish(session, "agents", self._agents_payload(session, [agent]))
     
     def set_current_agent(self, session_id, agent_name):
         """Set currently running agent."""
-        if session_id in self.sessions:
-            self.sessions[session_id]["current_agent"] = agent_name
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session is not None:
+                session.current_agent = agent_name
+                self._publish(session, "agents", self._agents_payload(session, []))
     
     def update_progress(self, session_id, message, level="info"):
         """Update session progress."""
-        if session_id in self.sessions:
-            self.sessions[session_id]["progress"].append({
-                "message": message,
-                "level": level,
-                "timestamp": datetime.now().isoformat(),
-            })
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session is not None:
+                session.progress.append(ProgressEvent(message, level, time.time_ns()))
+                self._publish(session, "progress", {"message": message, "level": level})
     
     def set_status(self, session_id, status):
         """Set session status."""
-        if session_id in self.sessions:
-            self.sessions[session_id]["status"] = status
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session is not None:
+                session.status = status
+                self._publish(session, "status", {"status": status, "error": session.error})
     
     def set_result(self, session_id, result):
         """Set evaluation result."""
-        if session_id in self.sessions:
-            self.sessions[session_id]["result"] = result
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session is not None:
+                session.result = result
     
     def set_error(self, session_id, error):
         """Set error."""
-        if session_id in self.sessions:
-            self.sessions[session_id]["error"] = error
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session is not None:
+                session.error = error
+                session.status_cache = None
     
-    def get_session(self, session_id):
+    def get_session(self, session_id) -> Optional[Session]:
         """Get session data."""
-        return self.sessions.get(session_id, {})
+        with self._lock:
+            return self.sessions.get(session_id)
+    
+    @classmethod
+    def _status_payload(cls, session):
+        """Full status snapshot of a session (caller holds the lock)."""
+        return {
+            "status": session.status,
+            # Progress as list of messages for frontend
+            "progress": [event.message for event in session.progress],
+            "error": session.error,
+            "start_time": format_timestamp_ns(session.start_time_ns),
+            **cls._agents_payload(session),
+        }
+    
+    def get_status(self, session_id) -> Optional[Dict[str, Any]]:
+        """Return a consistent snapshot of a session's status, or None."""
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session is None:
+                return None
+            return self._status_payload(session)
+    
+    def get_status_body(self, session_id) -> Optional[Tuple[bytes, str]]:
+        """Return the JSON-encoded status and its ETag, or None.
+        
+        The encoded body is cached on the session until its next change, so
+        repeated polls of an idle session don't rebuild the payload.
+        """
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session is None:
+                return None
+            if session.status_cache is None:
+                body = _json_encoder.encode(self._status_payload(session))
+                etag = hashlib.blake2s(body, digest_size=8).hexdigest()
+                session.status_cache = (body, etag)
+            return session.status_cache
+    
+    def subscribe(self, session_id):
+        """Open an event stream for a session.
+        
+        Returns ``(snapshot, events)``: the current status payload and a queue
+        that receives every later change, or None if the session is unknown.
+        """
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session is None:
+                return None
+            events = queue.SimpleQueue()
+            session.subscribers.append(events)
+            return self.get_status(session_id), events
+    
+    def unsubscribe(self, session_id, events):
+        """Close an event stream opened with subscribe()."""
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session is not None and events in session.subscribers:
+                session.subscribers.remove(events)
 
 
-# Global session manager
+class ResultCache:
+    """Bounded LRU cache of evaluation results keyed on the normalized idea.
+    
+    Resubmitting the same idea (ignoring case and whitespace) returns the
+    stored result instead of running the full LLM pipeline again.
+    """
+    
+    def __init__(self, max_entries: int = RESULT_CACHE_SIZE):
+        self._entries: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._lock = Lock()
+        self._max_entries = max_entries
+    
+    @staticmethod
+    def make_key(invention: InventionInput) -> str:
+        """Hash the fields that determine an evaluation's outcome."""
+        canonical = (
+            " ".join(invention.title.split()).lower(),
+            " ".join(invention.description.split()).lower(),
+            " ".join(invention.technical_domain.split()).lower(),
+            sorted(" ".join(d.split()).lower() for d in invention.application_domains),
+        )
+        return hashlib.sha256(msgspec.msgpack.encode(canonical)).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, or None."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+    
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+# Global session manager and result cache
 session_manager = SessionManager()
+result_cache = ResultCache()
+
+# Evaluations run concurrently on one background event loop that lives for
+# the whole process. Agent LLM calls are async, so evaluations interleave
+# on the loop instead of each holding a thread; a semaphore caps how many
+# are in flight at once.
+MAX_CONCURRENT_EVALUATIONS = 4
+eval_loop = asyncio.new_event_loop()
+Thread(target=eval_loop.run_forever, name="eval-loop", daemon=True).start()
+_eval_slots = asyncio.Semaphore(MAX_CONCURRENT_EVALUATIONS)
+
+# Each open event stream holds a worker thread for the whole evaluation, so
+# streams are capped to keep threads free for /api/status and /api/evaluate
+_sse_slots = BoundedSemaphore(MAX_SSE_STREAMS)
+
+load_dotenv()
+
+
+@cache
+def get_openai_client() -> AsyncOpenAI:
+    """AsyncOpenAI client shared by all evaluations (created on first use, on the loop)."""
+    return create_openai_client()
+
+
+@cache
+def get_semantic_cache() -> SemanticCache:
+    """Semantic cache shared by all evaluations."""
+    return SemanticCache(threshold=SEMANTIC_CACHE_THRESHOLD, client=get_openai_client())
 
 
 class WebHooks(PipelineHooks):
@@ -114,6 +391,15 @@ class WebHooks(PipelineHooks):
         self.session_manager.set_current_agent(self.session_id, agent_name)
         self.agents_status[agent_name] = "running"
     
+    def on_agents_start(self, agent_names) -> None:
+        """Called when a group of agents starts."""
+        super().on_agents_start(agent_names)
+        for agent_name in agent_names:
+            self.session_manager.update_progress(self.session_id, f"🚀 Starting {agent_name}...")
+            self.agents_status[agent_name] = "running"
+        if agent_names:
+            self.session_manager.set_current_agent(self.session_id, agent_names[-1])
+    
     def on_agent_end(self, agent_name: str, output, input_tokens=0, output_tokens=0) -> None:
         """Called when agent ends."""
         super().on_agent_end(agent_name, output, input_tokens, output_tokens)
@@ -151,7 +437,8 @@ class WebHooks(PipelineHooks):
 
 def allowed_file(filename):
     """Check if file extension is allowed."""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    _, dot, extension = filename.rpartition('.')
+    return bool(dot) and extension.lower() in ALLOWED_EXTENSIONS
 
 
 @app.route('/')
@@ -160,63 +447,72 @@ def index():
     return render_template('index.html')
 
 
-def run_evaluation_async(session_id, invention, images_data):
-    """Run evaluation in background thread."""
+async def run_evaluation(session_id, invention, images_data, cache_key):
+    """Run the evaluation pipeline for a session on the evaluation loop."""
     try:
-        session_manager.update_progress(session_id, "📝 Processing patent idea...")
-        session_manager.update_progress(session_id, "🔄 Running Technology Feasibility Agent...")
-        
-        # Create pipeline with custom hooks
-        web_hooks = WebHooks(session_id, session_manager)
-        
-        # Run pipeline synchronously
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        pipeline = PatentRelevancePipeline(enable_hooks=False)
-        pipeline.hooks = web_hooks
+        async with _eval_slots:
+            session_manager.update_progress(session_id, "📝 Processing patent idea...")
+            
+            # Real progress is reported by the hooks while the pipeline runs
+            web_hooks = WebHooks(session_id, session_manager)
+            pipeline = PatentRelevancePipeline(
+                hooks=web_hooks,
+                cache=get_semantic_cache(),
+                client=get_openai_client(),
+            )
+            
+            async for event in pipeline.evaluate_stream(invention):
+                if isinstance(event, Final):
+                    result, degraded = event.output, event.degraded
         
-        result = loop.run_until_complete(pipeline.evaluate(invention))
+        result_data = result.model_dump()
+        # Results with fallback scores or no review would be served again on retry
+        if not degraded:
+            result_cache.put(cache_key, result_data)
         
-        # Add progress messages for other agents
-        session_manager.update_progress(session_id, "✅ Technology Feasibility Agent complete")
-        session_manager.update_progress(session_id, "🔄 Running Market Demand Agent...")
-        session_manager.update_progress(session_id, "✅ Market Demand Agent complete")
-        session_manager.update_progress(session_id, "🔄 Running Competitive Advantage Agent...")
-        session_manager.update_progress(session_id, "✅ Competitive Advantage Agent complete")
-        session_manager.update_progress(session_id, "🔄 Validating outputs...")
-        session_manager.update_progress(session_id, "✅ Validation complete")
-        session_manager.update_progress(session_id, "🔄 Running scoring engine...")
-        session_manager.update_progress(session_id, "✅ Scoring complete - PRS: {:.1f}/100".format(result.patent_relevance_score))
-        session_manager.update_progress(session_id, "🔄 Running quality review...")
-        session_manager.update_progress(session_id, "✅ Quality review complete")
-        session_manager.update_progress(session_id, "🔄 Generating SWOT analysis...")
-        session_manager.update_progress(session_id, "✅ SWOT analysis complete!")
-        
-        session_manager.set_status(session_id, "completed")
         session_manager.set_result(session_id, {
-            "result": result.model_dump(),
+            "result": result_data,
             "images": images_data,
         })
+        session_manager.set_status(session_id, "completed")
         
     except Exception as e:
-        session_manager.set_status(session_id, "failed")
         session_manager.set_error(session_id, str(e))
+        session_manager.set_status(session_id, "failed")
         session_manager.update_progress(session_id, f"❌ Error: {str(e)}", level="error")
 
 
+def _on_evaluation_done(session_id, future):
+    """Fail the session if its task died outside run_evaluation's own handling."""
+    if future.cancelled():
+        error = "Evaluation was cancelled"
+    elif future.exception() is not None:
+        error = str(future.exception())
+        app.logger.error("Evaluation task for %s crashed", session_id, exc_info=future.exception())
+    else:
+        return
+    
+    session = session_manager.get_session(session_id)
+    if session is not None and session.status not in FINISHED_STATUSES:
+        session_manager.set_error(session_id, error)
+        session_manager.set_status(session_id, "failed")
+
+
 @app.route('/api/evaluate', methods=['POST'])
 def evaluate():
     """Evaluate a patent idea."""
     try:
-        # Get JSON data
-        data = request.get_json()
+        # Decode and type-check the JSON body in one pass
+        try:
+            data = _evaluate_request_decoder.decode(request.get_data())
+        except msgspec.DecodeError as e:
+            return jsonify({"error": f"Invalid request body: {e}"}), 400
         
-        title = data.get('title', '').strip()
-        description = data.get('description', '').strip()
-        technical_domain = data.get('technical_domain', 'General').strip()
-        application_domains = data.get('application_domains', [])
-        images = data.get('images', [])
+        title = data.title.strip()
+        description = data.description.strip()
+        technical_domain = data.technical_domain.strip()
+        application_domains = data.application_domains
+        images = data.images
         
         # Validate input
         if not title or len(title) < 5:
@@ -225,12 +521,23 @@ def evaluate():
         if not description or len(description) < 20:
             return jsonify({"error": "Description must be at least 20 characters"}), 400
         
-        # Create session
-        session_id = f"eval_{int(datetime.now().timestamp() * 1000)}"
-        session_manager.create_session(session_id)
-        session_manager.set_status(session_id, "running")
+        # Keep only a short preview of each image; check everything before the
+        # session exists so a bad request can't leave it stuck in "running"
+        images_data = []
+        for idx, img in enumerate(images):
+            if isinstance(img, dict) and 'data' in img:
+                preview = img['data']
+                if not isinstance(preview, str):
+                    return jsonify({"error": f"Image {idx} data must be a string"}), 400
+                if len(preview) > IMAGE_PREVIEW_CHARS:
+                    preview = preview[:IMAGE_PREVIEW_CHARS] + '...'
+                images_data.append({
+                    "name": img.get('name', f'image_{idx}'),
+                    "data": preview,
+                })
         
         # Create invention input
+        session_id = f"eval_{time.time_ns() // 1_000_000}"
         invention = InventionInput(
             idea_id=session_id,
             title=title,
@@ -239,19 +546,27 @@ def evaluate():
             application_domains=application_domains or ['General'],
         )
         
-        # Save images metadata
-        images_data = []
-        for idx, img in enumerate(images):
-            if isinstance(img, dict) and 'data' in img:
-                images_data.append({
-                    "name": img.get('name', f'image_{idx}'),
-                    "data": img['data'][:100] + '...' if len(img['data']) > 100 else img['data']
-                })
+        # Create session
+        session_manager.create_session(session_id)
+        session_manager.set_status(session_id, "running")
         
-        # Run evaluation in background thread
-        eval_thread = Thread(target=run_evaluation_async, args=(session_id, invention, images_data))
-        eval_thread.daemon = True
-        eval_thread.start()
+        # Serve repeat submissions from the result cache
+        cache_key = ResultCache.make_key(invention)
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            session_manager.update_progress(session_id, "♻️ Identical idea already evaluated, reusing result")
+            session_manager.set_result(session_id, {
+                "result": {**cached, "idea_id": session_id},
+                "images": images_data,
+            })
+            session_manager.set_status(session_id, "completed")
+        else:
+            # Run evaluation on the background event loop
+            future = asyncio.run_coroutine_threadsafe(
+                run_evaluation(session_id, invention, images_data, cache_key),
+                eval_loop,
+            )
+            future.add_done_callback(partial(_on_evaluation_done, session_id))
         
         return jsonify({
             "session_id": session_id,
@@ -266,23 +581,71 @@ def evaluate():
 @app.route('/api/status/<session_id>', methods=['GET'])
 def get_status(session_id):
     """Get evaluation status."""
-    session = session_manager.get_session(session_id)
+    cached = session_manager.get_status_body(session_id)
     
-    if not session:
+    if cached is None:
         return jsonify({"error": "Session not found"}), 404
     
-    # Return progress as list of messages for frontend
-    progress_messages = [msg.get("message", str(msg)) if isinstance(msg, dict) else str(msg) 
-                        for msg in session.get("progress", [])]
+    # Unchanged sessions answer If-None-Match polls with 304 Not Modified
+    body, etag = cached
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
+def format_sse(event, data):
+    """Format one Server-Sent Events message with a JSON payload."""
+    return f"event: {event}\ndata: {_json_encoder.encode(data).decode()}\n\n"
+
+
+@app.route('/api/stream/<session_id>', methods=['GET'])
+def stream_status(session_id):
+    """Stream evaluation progress as Server-Sent Events.
+    
+    The first event is a full ``snapshot`` (same shape as /api/status); after
+    that only changes are sent as ``progress``, ``agents`` (just the agent
+    entries added since the previous event) and ``status`` events. The stream
+    ends once the evaluation has finished.
+    
+    At most MAX_SSE_STREAMS streams are open at once; beyond that the request
+    gets 503 and the client falls back to polling /api/status.
+    """
+    if not _sse_slots.acquire(blocking=False):
+        response = jsonify({"error": "Too many open streams, poll /api/status instead"})
+        response.headers["Retry-After"] = str(SSE_KEEPALIVE_SECONDS)
+        return response, 503
+    
+    subscription = session_manager.subscribe(session_id)
+    if subscription is None:
+        _sse_slots.release()
+        return jsonify({"error": "Session not found"}), 404
+    snapshot, events = subscription
+    
+    def generate():
+        yield format_sse("snapshot", snapshot)
+        status = snapshot["status"]
+        while status not in FINISHED_STATUSES:
+            try:
+                event, data = events.get(timeout=SSE_KEEPALIVE_SECONDS)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            yield format_sse(event, data)
+            if event == "status":
+                status = data["status"]
+    
+    def close():
+        session_manager.unsubscribe(session_id, events)
+        _sse_slots.release()
     
-    return jsonify({
-        "status": session.get("status"),
-        "progress": progress_messages,
-        "error": session.get("error"),
-        "start_time": session.get("start_time"),
-        "agents": session.get("agents", []),
-        "current_agent": session.get("current_agent"),
-    }), 200
+    response = Response(generate(), mimetype='text/event-stream', headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+    })
+    # Runs when the response closes, even if the client left before the first event
+    response.call_on_close(close)
+    return response
 
 
 @app.route('/api/result/<session_id>', methods=['GET'])
@@ -293,20 +656,20 @@ def get_result(session_id):
     if not session:
         return jsonify({"error": "Session not found"}), 404
     
-    if session["status"] not in ["completed", "complete"]:
-        return jsonify({"error": f"Evaluation status: {session['status']}"}), 400
+    if session.status not in ["completed", "complete"]:
+        return jsonify({"error": f"Evaluation status: {session.status}"}), 400
     
-    result_data = session.get("result", {})
+    result_data = session.result or {}
     if isinstance(result_data, dict) and "result" in result_data:
-        return jsonify(result_data["result"]), 200
+        return json_response(result_data["result"])
     
-    return jsonify(result_data), 200
+    return json_response(result_data)
 
 
 @app.route('/uploads/<filename>', methods=['GET'])
 def download_file(filename):
     """Download uploaded file."""
-    return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
+    return send_from_directory(app.config['UPLOAD_FOLDER'], filename, conditional=True)
 
 
 @app.route('/api/health', methods=['GET'])
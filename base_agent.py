@@ -1,14 +1,124 @@
 """Base agent interfaces and utilities."""
+import asyncio
+import os
 from abc import ABC, abstractmethod
+from typing import Any, Dict
+import httpx
+import msgspec
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from models import TriagedInvention, DimensionScore
+from validation import OutputValidationError, sanitize_llm_output
+
+LLM_TIMEOUT_SECONDS = 15  # Per-call cap so one slow agent can't stall the pipeline
+SIGNAL_MAX_TOKENS = 150  # A signal's JSON answer is well under this
+LLM_STOP_SEQUENCES = ["\n```", "\n\n\n"]  # Cut off trailing fences or whitespace runs
+LLM_MAX_CONNECTIONS = 32  # Pool size of the shared client
+
+_json_object_decoder = msgspec.json.Decoder(Dict[str, Any])
+
+
+def create_openai_client() -> AsyncOpenAI:
+    """
+    Create an AsyncOpenAI client to be shared by every agent.
+    
+    The client keeps one pooled HTTP/2 connection, so concurrent agent calls
+    are multiplexed over it instead of each paying its own TLS handshake.
+    """
+    return AsyncOpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=DefaultAsyncHttpxClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_CONNECTIONS,
+            ),
+        ),
+    )
+
+
+async def call_llm_json(
+    client: AsyncOpenAI,
+    name: str,
+    system_prompt: str,
+    user_payload: str,
+    max_tokens: int,
+    **params: Any,
+) -> Dict[str, Any]:
+    """
+    Request a JSON-mode chat completion and decode the returned object.
+    
+    Args:
+        client: Shared OpenAI client
+        name: Agent name (also used as the prompt cache key)
+        system_prompt: Static instructions for the agent
+        user_payload: Request-specific content
+        max_tokens: Completion token limit
+        **params: Extra completion parameters (e.g. temperature)
+    
+    A response cut off by the token limit is retried once with the limit doubled.
+    
+    Returns:
+        Decoded JSON object
+    
+    Raises:
+        OutputValidationError: If the response is not a JSON object
+    """
+    for attempt in range(2):
+        async with asyncio.timeout(LLM_TIMEOUT_SECONDS):
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"},
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_payload},
+                ],
+                stop=LLM_STOP_SEQUENCES,
+                prompt_cache_key=name,
+                **params,
+            )
+        if response.choices[0].finish_reason != "length":
+            break
+        max_tokens *= 2
+    
+    # JSON mode shouldn't emit code fences, but tolerate them anyway
+    text = sanitize_llm_output(response.choices[0].message.content or "")
+    try:
+        return _json_object_decoder.decode(text)
+    except msgspec.DecodeError as e:
+        raise OutputValidationError(f"Invalid JSON from {name}: {e}")
 
 
 class SignalAgent(ABC):
     """Base class for signal-gathering agents."""
     
+    # Score dimension this agent produces and its task-specific prompt lines
+    dimension: str = ""
+    instruction: str = ""
+    SYSTEM_PROMPT: str = ""
+    
     def __init__(self, name: str):
         self.name = name
     
+    @staticmethod
+    def invention_payload(invention: TriagedInvention) -> str:
+        """Invention-specific user message; the static prompt goes in the system message."""
+        return (
+            f"Concept: {invention.core_concept}\n"
+            f"Keywords: {invention.keywords_text}\n"
+            f"Domains: {invention.domains_text}"
+        )
+    
+    async def _call_llm_json(self, invention: TriagedInvention, max_tokens: int = SIGNAL_MAX_TOKENS) -> Dict[str, Any]:
+        """Ask the LLM to score this agent's dimension and return the decoded JSON."""
+        return await call_llm_json(
+            self.client,
+            self.name,
+            self.SYSTEM_PROMPT,
+            self.invention_payload(invention),
+            max_tokens,
+        )
+    
     @abstractmethod
     async def compute_signal(self, invention: TriagedInvention) -> DimensionScore:
         """Compute a single dimension score."""
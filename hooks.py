@@ -1,9 +1,16 @@
 """Lifecycle hooks for pipeline observability and monitoring."""
+import logging
 import time
-from datetime import datetime
-from typing import Any, Dict, List
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, List
 from dataclasses import dataclass, field
 
+MAX_PIPELINE_FLAGS = 1000  # Most recent flags kept per hooks instance
+MAX_AGENT_ISSUES = 64  # Most recent errors/flags kept per agent
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class AgentMetrics:
@@ -16,8 +23,8 @@ class AgentMetrics:
     input_tokens: int = 0
     output_tokens: int = 0
     output_quality_score: float = 0.0
-    errors: List[str] = field(default_factory=list)
-    flags: List[str] = field(default_factory=list)
+    errors: Deque[str] = field(default_factory=lambda: deque(maxlen=MAX_AGENT_ISSUES))
+    flags: Deque[str] = field(default_factory=lambda: deque(maxlen=MAX_AGENT_ISSUES))
     
     def finalize(self):
         """Calculate final metrics."""
@@ -31,14 +38,18 @@ class PipelineHooks:
     def __init__(self):
         """Initialize pipeline hooks."""
         self.metrics: Dict[str, AgentMetrics] = {}
-        self.all_flags: List[str] = []
+        self.all_flags: Deque[str] = deque(maxlen=MAX_PIPELINE_FLAGS)
+        self.flag_count = 0  # Includes flags rotated out of all_flags
         self.start_time = time.time()
         self.total_tokens = 0
         self.total_cost = 0.0
+        self.total_duration = 0.0
         
         # Pricing (as of January 2026)
         self.cost_per_1k_input = 0.015  # gpt-4o-mini
         self.cost_per_1k_output = 0.06
+        self._cost_per_input = self.cost_per_1k_input / 1000
+        self._cost_per_output = self.cost_per_1k_output / 1000
     
     def on_agent_start(self, agent_name: str) -> None:
         """Called when an agent starts execution."""
@@ -46,7 +57,14 @@ class PipelineHooks:
             agent_name=agent_name,
             start_time=time.time(),
         )
-        print(f"  [AGENT START] {agent_name} at {datetime.now().strftime('%H:%M:%S')}")
+        logger.info("  [AGENT START] %s", agent_name)
+    
+    def on_agents_start(self, agent_names: Iterable[str]) -> None:
+        """Called when several agents start together (e.g. the parallel signal agents)."""
+        start_time = time.time()
+        for agent_name in agent_names:
+            self.metrics[agent_name] = AgentMetrics(agent_name=agent_name, start_time=start_time)
+            logger.info("  [AGENT START] %s", agent_name)
     
     def on_agent_end(
         self,
@@ -65,18 +83,17 @@ class PipelineHooks:
             metrics.finalize()
             
             # Calculate cost for this agent
-            agent_cost = (
-                (input_tokens * self.cost_per_1k_input) +
-                (output_tokens * self.cost_per_1k_output)
-            ) / 1000
+            agent_cost = input_tokens * self._cost_per_input + output_tokens * self._cost_per_output
             self.total_cost += agent_cost
             self.total_tokens += metrics.tokens_used
+            self.total_duration += metrics.duration_seconds
             
-            print(
-                f"  [AGENT END] {agent_name} | "
-                f"Duration: {metrics.duration_seconds:.2f}s | "
-                f"Tokens: {metrics.tokens_used} | "
-                f"Cost: ${agent_cost:.4f}"
+            logger.info(
+                "  [AGENT END] %s | Duration: %.2fs | Tokens: %d | Cost: $%.4f",
+                agent_name,
+                metrics.duration_seconds,
+                metrics.tokens_used,
+                agent_cost,
             )
     
     def on_score_generated(
@@ -87,16 +104,20 @@ class PipelineHooks:
         sources_count: int,
     ) -> None:
         """Called when a dimension score is generated."""
-        print(
-            f"    • {dimension}: {raw_score:.1f}/5.0 "
-            f"(confidence: {confidence:.2f}, sources: {sources_count})"
+        logger.info(
+            "    • %s: %.1f/5.0 (confidence: %.2f, sources: %d)",
+            dimension,
+            raw_score,
+            confidence,
+            sources_count,
         )
     
     def on_validation_error(self, agent_name: str, error_msg: str) -> None:
         """Called when validation fails."""
         flag = f"VALIDATION_ERROR in {agent_name}: {error_msg}"
         self.all_flags.append(flag)
-        print(f"    ⚠️  {flag}")
+        self.flag_count += 1
+        logger.warning("    ⚠️  %s", flag)
     
     def on_quality_check(
         self,
@@ -108,50 +129,55 @@ class PipelineHooks:
             for issue in quality_issues:
                 flag = f"QUALITY_ISSUE in {agent_name}: {issue}"
                 self.all_flags.append(flag)
-                print(f"    ⚠️  {flag}")
+                self.flag_count += 1
+                logger.warning("    ⚠️  %s", flag)
     
     def on_pipeline_complete(self) -> None:
         """Called when entire pipeline completes."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         end_time = time.time()
         total_duration = end_time - self.start_time
         
-        print("\n" + "=" * 80)
-        print("PIPELINE EXECUTION SUMMARY")
-        print("=" * 80)
-        print(f"Total Duration: {total_duration:.2f}s")
-        print(f"Total Tokens Used: {self.total_tokens:,}")
-        print(f"Estimated Cost: ${self.total_cost:.4f}")
-        print(f"Agents Executed: {len(self.metrics)}")
-        print(f"Quality Flags: {len(self.all_flags)}")
+        logger.info("\n%s", "=" * 80)
+        logger.info("PIPELINE EXECUTION SUMMARY")
+        logger.info("=" * 80)
+        logger.info("Total Duration: %.2fs", total_duration)
+        logger.info("Total Tokens Used: %d", self.total_tokens)
+        logger.info("Estimated Cost: $%.4f", self.total_cost)
+        logger.info("Agents Executed: %d", len(self.metrics))
+        logger.info("Quality Flags: %d", self.flag_count)
         
         if self.metrics:
-            print("\nPer-Agent Metrics:")
+            logger.info("\nPer-Agent Metrics:")
             for agent_name, metrics in self.metrics.items():
-                print(
-                    f"  {agent_name:.<40} "
-                    f"{metrics.duration_seconds:>6.2f}s | "
-                    f"{metrics.tokens_used:>6} tokens | "
-                    f"confidence: {metrics.output_quality_score:>4.2f}"
+                logger.info(
+                    "  %s %6.2fs | %6d tokens | confidence: %4.2f",
+                    agent_name.ljust(40, "."),
+                    metrics.duration_seconds,
+                    metrics.tokens_used,
+                    metrics.output_quality_score,
                 )
         
         if self.all_flags:
-            print(f"\n⚠️  Flags ({len(self.all_flags)}):")
-            for flag in self.all_flags[:10]:  # Show first 10
-                print(f"  - {flag}")
-            if len(self.all_flags) > 10:
-                print(f"  ... and {len(self.all_flags) - 10} more")
+            logger.info("\n⚠️  Flags (%d):", self.flag_count)
+            for flag in islice(self.all_flags, 10):  # Show first 10
+                logger.info("  - %s", flag)
+            if self.flag_count > 10:
+                logger.info("  ... and %d more", self.flag_count - 10)
         
-        print("=" * 80 + "\n")
+        logger.info("%s\n", "=" * 80)
     
     def get_summary(self) -> Dict[str, Any]:
         """Return summary metrics as dict."""
         return {
-            "total_duration_seconds": sum(m.duration_seconds for m in self.metrics.values()),
+            "total_duration_seconds": self.total_duration,
             "total_tokens": self.total_tokens,
             "estimated_cost": self.total_cost,
             "agents_executed": len(self.metrics),
-            "quality_flags": len(self.all_flags),
-            "flags": self.all_flags,
+            "quality_flags": self.flag_count,
+            "flags": list(self.all_flags),
             "per_agent_metrics": {
                 name: {
                     "duration_seconds": m.duration_seconds,
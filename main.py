@@ -1,8 +1,13 @@
 """Main entry point - Simple example runner with enhanced observability."""
 import asyncio
+import logging
+import sys
+from pathlib import Path
+import msgspec
 from pipeline import PatentRelevancePipeline
 from models import InventionInput
-import json
+
+_json_encoder = msgspec.json.Encoder()
 
 
 async def run_example():
@@ -26,7 +31,10 @@ async def run_example():
     
     # Run pipeline with hooks and validation
     pipeline = PatentRelevancePipeline(enable_hooks=True)
-    result = await pipeline.evaluate(invention)
+    try:
+        result = await pipeline.evaluate(invention)
+    finally:
+        await pipeline.aclose()
     
     # Display results
     print("\n" + "=" * 80)
@@ -69,11 +77,13 @@ async def run_example():
     # Save full result
     print("\n" + "=" * 80)
     print("Saving full output to output.json...")
-    with open("output.json", "w") as f:
-        json.dump(result.model_dump(), f, indent=2)
+    payload = msgspec.json.format(_json_encoder.encode(result.model_dump()), indent=2)
+    # Single write of the pre-serialized buffer, kept off the event loop
+    await asyncio.to_thread(Path("output.json").write_bytes, payload)
     print("✓ Complete results saved to output.json")
     print("=" * 80 + "\n")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     asyncio.run(run_example())
@@ -1,7 +1,10 @@
 """Data models for Patent Relevance Scoring system."""
-from typing import Any, Dict, List, Literal
+import math
+from functools import cached_property
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, Iterable, List, Literal, Mapping, Sequence, Union
 from pydantic import BaseModel, Field, field_validator, model_validator
-import json
+import msgspec
 
 
 class InventionInput(BaseModel):
@@ -21,6 +24,23 @@ class InventionInput(BaseModel):
         return v
 
 
+class EvaluateRequest(msgspec.Struct):
+    """JSON body of a web evaluation request (decoded with msgspec)."""
+    title: str = ""
+    description: str = ""
+    technical_domain: str = "General"
+    application_domains: List[str] = []
+    images: List[Any] = []
+
+
+class DimensionScoreIn(msgspec.Struct):
+    """JSON answer of a signal agent (decoded with msgspec; ranges checked while decoding)."""
+    sources: Annotated[List[Any], msgspec.Meta(min_length=1)]
+    notes: str
+    aggregate_score: Annotated[float, msgspec.Meta(ge=0, le=5)] = 0.0
+    confidence: Annotated[float, msgspec.Meta(ge=0, le=1)] = 0.5
+
+
 class TriagedInvention(BaseModel):
     """Normalized invention after triage."""
     idea_id: str
@@ -28,6 +48,16 @@ class TriagedInvention(BaseModel):
     technical_keywords: List[str]
     application_domains: List[str]
     analysis_depth: Literal["triage", "full"]
+    
+    @cached_property
+    def keywords_text(self) -> str:
+        """Comma-joined keywords, built once and shared by every signal prompt."""
+        return ", ".join(self.technical_keywords)
+    
+    @cached_property
+    def domains_text(self) -> str:
+        """Comma-joined application domains, built once and shared by every signal prompt."""
+        return ", ".join(self.application_domains)
 
 
 class DimensionScore(BaseModel):
@@ -93,15 +123,7 @@ class PatentRelevanceOutput(BaseModel):
     confidence: Literal["low", "medium", "high"]
     evidence_map: Dict[str, Dict[str, Any]]
     flags: List[str] = Field(default_factory=list)
-    usage_summary: Dict[str, int] = Field(default_factory=dict, description="Token usage metrics")
-    
-    @field_validator("patent_relevance_score")
-    @classmethod
-    def validate_prs(cls, v):
-        """Ensure PRS is in valid range."""
-        if not (0 <= v <= 100):
-            raise ValueError(f"Patent Relevance Score must be [0-100], got {v}")
-        return v
+    usage_summary: Dict[str, Union[int, float]] = Field(default_factory=dict, description="Token usage metrics")
     
     @model_validator(mode='after')
     def validate_consistency(self):
@@ -112,11 +134,27 @@ class PatentRelevanceOutput(BaseModel):
 
 
 # Scoring weights (immutable)
-SCORING_WEIGHTS = {
+SCORING_WEIGHTS = MappingProxyType({
     "tech_momentum": 0.20,
     "market_gravity": 0.25,
     "white_space": 0.20,
     "strategic_leverage": 0.15,
     "timing": 0.10,
     "regulatory_alignment": 0.10,
-}
+})
+
+# Dimension order and matching factors, precomputed for the scoring loop.
+# Each factor folds the 0-5 -> 0-100 normalization into the weight.
+SCORING_DIMENSIONS = tuple(SCORING_WEIGHTS)
+_SCORING_FACTORS = tuple(weight * 100 / 5 for weight in SCORING_WEIGHTS.values())
+
+
+def weighted_score(raw_scores: Mapping[str, float]) -> float:
+    """Return the weighted PRS (0-100) for raw 0-5 dimension scores."""
+    return math.sumprod(map(raw_scores.__getitem__, SCORING_DIMENSIONS), _SCORING_FACTORS)
+
+
+def weighted_scores(rows: Iterable[Sequence[float]]) -> List[float]:
+    """Return the weighted PRS for many rows of raw scores in SCORING_DIMENSIONS order."""
+    factors = _SCORING_FACTORS
+    return [math.sumprod(row, factors) for row in rows]
@@ -1,182 +1,368 @@
 """Main orchestration pipeline for Patent Relevance Scoring."""
 import asyncio
 import json
-import os
+import logging
+import sys
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Literal, Optional
 from dotenv import load_dotenv
-from models import InventionInput, PatentRelevanceOutput
+from openai import AsyncOpenAI
+from models import DimensionScore, InventionInput, PatentRelevanceOutput, SWOT, TriagedInvention
+from base_agent import create_openai_client
 from triage_agent import TriageOrchestrator
-from signal_agents import (
-    TechnologySignalAgent,
-    MarketSignalAgent,
-    ProductLandscapeAgent,
-    RegulatorySignalAgent,
-    StrategicLeverageAgent,
-    TimingAgent,
-)
+from signal_agents import SIGNAL_SPECS, BatchedSignalAgent, LLMSignalAgent
 from scoring_agent import ScoringAgent
 from reviewer_agent import ReviewerAgent
 from swot_agent import SWOTAgent
 from hooks import PipelineHooks
-from validation import OutputValidator
+from semantic_cache import SemanticCache
+from validation import OutputValidator, OutputValidationError
+
+
+class PipelineEvent:
+    """Base class for events yielded by PatentRelevancePipeline.evaluate_stream."""
+    __slots__ = ()
+
+
+@dataclass(frozen=True, slots=True)
+class TriageDone(PipelineEvent):
+    """Triage finished."""
+    triaged: TriagedInvention
+
+
+@dataclass(frozen=True, slots=True)
+class SignalDone(PipelineEvent):
+    """One signal dimension was scored."""
+    dimension: str
+    score: DimensionScore
+
+
+@dataclass(frozen=True, slots=True)
+class PRSReady(PipelineEvent):
+    """The deterministic PRS was calculated."""
+    prs: float
+    raw_scores: Dict[str, float]
+    normalized_scores: Dict[str, float]
+
+
+@dataclass(frozen=True, slots=True)
+class SWOTDone(PipelineEvent):
+    """The rule-based SWOT was generated."""
+    swot: SWOT
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewDone(PipelineEvent):
+    """The quality review finished."""
+    confidence: Literal["low", "medium", "high"]
+    flags: List[str]
+
+
+@dataclass(frozen=True, slots=True)
+class Final(PipelineEvent):
+    """The complete pipeline output."""
+    output: PatentRelevanceOutput
+    degraded: bool = False  # A dimension used its fallback score or the review failed
 
 
 class PatentRelevancePipeline:
     """Orchestrates the entire patent relevance scoring pipeline."""
     
-    def __init__(self, enable_hooks: bool = True):
+    def __init__(
+        self,
+        enable_hooks: bool = True,
+        hooks: Optional[PipelineHooks] = None,
+        batch_signals: bool = False,
+        cache: Optional[SemanticCache] = None,
+        client: Optional[AsyncOpenAI] = None,
+        speculative_signals: bool = False,
+    ):
         load_dotenv()
         
+        # One async client shared by every agent, so calls reuse pooled connections
+        self._owns_client = client is None
+        self.client = client or create_openai_client()
+        
         # Initialize all agents
-        self.triage = TriageOrchestrator()
-        self.tech_agent = TechnologySignalAgent()
-        self.market_agent = MarketSignalAgent()
-        self.product_agent = ProductLandscapeAgent()
-        self.regulatory_agent = RegulatorySignalAgent()
-        self.strategic_agent = StrategicLeverageAgent()
-        self.timing_agent = TimingAgent()
+        self.triage = TriageOrchestrator(self.client)
+        self.signal_agents = [LLMSignalAgent(spec, self.client) for spec in SIGNAL_SPECS]
+        self.signal_agent_names = tuple(agent.name for agent in self.signal_agents)
+        self.signal_dimensions = tuple(agent.dimension for agent in self.signal_agents)
         self.scoring_agent = ScoringAgent()
-        self.reviewer_agent = ReviewerAgent()
+        self.reviewer_agent = ReviewerAgent(self.client)
         self.swot_agent = SWOTAgent()
         
-        # Initialize hooks for observability
-        self.hooks = PipelineHooks() if enable_hooks else None
+        # Optionally fetch all six signals with one LLM request
+        self.batched_signals = BatchedSignalAgent(self.signal_agents, self.client) if batch_signals else None
+        
+        # Optional cache of agent outputs shared across evaluations
+        self.cache = cache
+        
+        # Optionally start keyword-independent signals while triage is still running
+        self.speculative_signals = speculative_signals
+        
+        # Initialize hooks for observability (caller-supplied hooks take precedence)
+        if hooks is not None:
+            self.hooks = hooks
+        else:
+            self.hooks = PipelineHooks() if enable_hooks else None
+    
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool if this pipeline created its own client."""
+        if self._owns_client:
+            await self.client.close()
+    
+    async def _run_signal(self, agent, triaged, cache_vector=None, prefetched=None):
+        """Run one signal agent (or reuse a cached or prefetched score) and report completion to the hooks."""
+        score = self.cache.get(agent.name, cache_vector) if self.cache else None
+        if score is None and prefetched is not None:
+            score = await prefetched
+        if score is None:
+            score = await agent.compute_signal(triaged)
+            self._cache_score(agent, cache_vector, score)
+        if self.hooks:
+            self.hooks.on_agent_end(agent.name, score)
+        return score
+    
+    def _cache_score(self, agent, cache_vector, score):
+        """Cache a signal score unless it is the agent's fallback default."""
+        if self.cache and score is not agent.fallback_score():
+            self.cache.put(agent.name, cache_vector, score)
+    
+    @staticmethod
+    def _signal_cache_text(triaged) -> str:
+        """Text the signal prompts depend on, in a canonical order."""
+        return (
+            f"{triaged.core_concept}\n"
+            f"Keywords: {', '.join(sorted(triaged.technical_keywords))}\n"
+            f"Domains: {', '.join(sorted(triaged.application_domains))}"
+        )
+    
+    def _start_speculative_signals(self, invention: InventionInput) -> dict:
+        """Start prefetchable signal agents on the untriaged invention."""
+        provisional = TriagedInvention(
+            idea_id=invention.idea_id,
+            core_concept=f"{invention.title}: {invention.description.strip()}",
+            technical_keywords=[],
+            application_domains=invention.application_domains,
+            analysis_depth="full",
+        )
+        return {
+            agent.name: asyncio.create_task(agent.compute_signal(provisional))
+            for agent in self.signal_agents
+            if agent.spec.prefetchable
+        }
+    
+    @staticmethod
+    def _discard_tasks(tasks) -> None:
+        """Cancel tasks whose results are no longer needed, consuming any exception they raised."""
+        for task in tasks:
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            task.cancel()
+    
+    @staticmethod
+    def _speculation_holds(invention: InventionInput, triaged) -> bool:
+        """Whether triage only extracted terms already present in the raw invention text."""
+        text = f"{invention.title} {invention.description} {' '.join(invention.application_domains)}".lower()
+        return all(
+            term.lower() in text
+            for term in (*triaged.technical_keywords, *triaged.application_domains)
+        )
+    
+    async def _triage(self, invention: InventionInput):
+        """Triage an invention, reusing a cached result for near-duplicate text."""
+        if not self.cache:
+            return await self.triage.triage(invention)
+        
+        vector = await self.cache.embed(f"{invention.title}\n{invention.description}")
+        triaged = self.cache.get(self.triage.name, vector)
+        if triaged is not None:
+            return triaged.model_copy(update={"idea_id": invention.idea_id})
+        
+        triaged = await self.triage.triage(invention)
+        self.cache.put(self.triage.name, vector, triaged)
+        return triaged
     
     async def evaluate(self, invention: InventionInput) -> PatentRelevanceOutput:
+        """Run the full evaluation pipeline and return only the final output."""
+        output = None
+        async for event in self.evaluate_stream(invention):
+            if isinstance(event, Final):
+                output = event.output
+        return output
+    
+    async def evaluate_stream(self, invention: InventionInput) -> AsyncIterator[PipelineEvent]:
         """
-        Run the full evaluation pipeline.
+        Run the full evaluation pipeline, yielding events as each stage finishes.
         
         Steps:
-        1. Triage and normalize input
-        2. Run signal agents in parallel
+        1. Triage and normalize input (TriageDone)
+        2. Run signal agents in parallel (SignalDone per dimension, in completion order)
         3. Validate scores
-        4. Score deterministically
-        5. Review and flag
-        6. Generate SWOT
-        7. Return structured output with usage metrics
+        4. Score deterministically (PRSReady)
+        5. Review and flag (ReviewDone)
+        6. Generate SWOT (SWOTDone, usually before ReviewDone)
+        7. Return structured output with usage metrics (Final)
         """
         print(f"\n[Pipeline] Evaluating: {invention.idea_id}")
         print("=" * 80)
         
-        # Step 1: Triage
-        print("[Step 1/6] Triage and normalization...")
-        triaged = await self.triage.triage(invention)
-        print(f"  ✓ Analysis depth: {triaged.analysis_depth}")
-        
-        # Step 2: Signal agents (parallel execution)
-        print("[Step 2/6] Gathering signals (parallel)...")
-        if self.hooks:
-            for agent in [
-                self.tech_agent,
-                self.market_agent,
-                self.product_agent,
-                self.regulatory_agent,
-                self.strategic_agent,
-                self.timing_agent,
-            ]:
-                self.hooks.on_agent_start(agent.name)
-        
-        signals = await asyncio.gather(
-            self.tech_agent.compute_signal(triaged),
-            self.market_agent.compute_signal(triaged),
-            self.product_agent.compute_signal(triaged),
-            self.regulatory_agent.compute_signal(triaged),
-            self.strategic_agent.compute_signal(triaged),
-            self.timing_agent.compute_signal(triaged),
-        )
-        
-        tech_score, market_score, product_score, regulatory_score, strategic_score, timing_score = signals
-        print("  ✓ All signals collected")
-        
-        # Step 3: Validate scores
-        print("[Step 3/6] Validating signal outputs...")
-        is_valid, validation_issues = OutputValidator.validate_multiple_scores(
-            [tech_score, market_score, product_score, regulatory_score, strategic_score, timing_score]
-        )
-        
-        if not is_valid:
-            print(f"  ⚠️  Validation issues detected:")
-            for issue in validation_issues:
-                print(f"    - {issue}")
+        # Tasks still running if the caller stops consuming events early
+        pending = []
+        try:
+            # Speculative signals only help the plain parallel path; cached and
+            # batched runs need the triaged text before they can start
+            speculative = {}
+            if self.speculative_signals and not self.cache and not self.batched_signals:
+                speculative = self._start_speculative_signals(invention)
+                pending.extend(speculative.values())
+            
+            # Step 1: Triage
+            print("[Step 1/6] Triage and normalization...")
+            triaged = await self._triage(invention)
+            print(f"  ✓ Analysis depth: {triaged.analysis_depth}")
+            
+            # Drop the speculative results if triage surfaced new terms
+            if speculative and not self._speculation_holds(invention, triaged):
+                print("  ↻ Triage added new terms; re-running prefetched signals")
+                self._discard_tasks(speculative.values())
+                speculative = {}
+            
+            yield TriageDone(triaged)
+            
+            # Step 2: Signal agents (parallel execution)
+            print("[Step 2/6] Gathering signals (parallel)...")
+            if self.hooks:
+                self.hooks.on_agents_start(self.signal_agent_names)
+            
+            # One embedding serves the cache lookups of all six signal agents
+            signal_vector = None
+            if self.cache:
+                signal_vector = await self.cache.embed(self._signal_cache_text(triaged))
+            
+            if self.batched_signals:
+                signals = [None] * len(self.signal_agents)
+                if self.cache:
+                    signals = [self.cache.get(agent.name, signal_vector) for agent in self.signal_agents]
+                if None in signals:
+                    batched = await self.batched_signals.compute_all(triaged)
+                    signals = [batched[agent.dimension] for agent in self.signal_agents]
+                    for agent, score in zip(self.signal_agents, signals):
+                        self._cache_score(agent, signal_vector, score)
+                for agent, score in zip(self.signal_agents, signals):
+                    if self.hooks:
+                        self.hooks.on_agent_end(agent.name, score)
+                    yield SignalDone(agent.dimension, score)
+            else:
+                tasks = [
+                    asyncio.create_task(
+                        self._run_signal(agent, triaged, signal_vector, speculative.get(agent.name))
+                    )
+                    for agent in self.signal_agents
+                ]
+                pending.extend(tasks)
+                remaining = set(tasks)
+                while remaining:
+                    done, remaining = await asyncio.wait(remaining, return_when=asyncio.FIRST_COMPLETED)
+                    for task, dimension in zip(tasks, self.signal_dimensions):
+                        if task in done:
+                            yield SignalDone(dimension, task.result())
+                signals = [task.result() for task in tasks]
+            
+            print("  ✓ All signals collected")
+            degraded = any(
+                score is agent.fallback_score()
+                for agent, score in zip(self.signal_agents, signals)
+            )
+            
+            # Step 3: Validate scores
+            print("[Step 3/6] Validating signal outputs...")
+            is_valid, validation_issues = OutputValidator.validate_multiple_scores(signals)
+            
+            if not is_valid:
+                print(f"  ⚠️  Validation issues detected:")
+                for issue in validation_issues:
+                    print(f"    - {issue}")
+                    if self.hooks:
+                        self.hooks.on_validation_error("signals_batch", issue)
+            else:
+                print("  ✓ All scores validated successfully")
+            
+            # Log scores with confidence
+            print("  Signal Scores:")
+            signals_dict = dict(zip(self.signal_dimensions, signals))
+            
+            for dim, score in signals_dict.items():
                 if self.hooks:
-                    self.hooks.on_validation_error("signals_batch", issue)
-        else:
-            print("  ✓ All scores validated successfully")
-        
-        # Log scores with confidence
-        print("  Signal Scores:")
-        signals_dict = {
-            "tech_momentum": tech_score,
-            "market_gravity": market_score,
-            "white_space": product_score,
-            "regulatory_alignment": regulatory_score,
-            "strategic_leverage": strategic_score,
-            "timing": timing_score,
-        }
-        
-        for dim, score in signals_dict.items():
+                    self.hooks.on_score_generated(
+                        dimension=dim,
+                        raw_score=score.raw_score,
+                        confidence=score.confidence,
+                        sources_count=len(score.sources),
+                    )
+            
+            # Step 4: Scoring (deterministic)
+            print("[Step 4/6] Calculating PRS (deterministic)...")
+            prs, raw_scores, normalized_scores, evidence_map = self.scoring_agent.calculate_prs(**signals_dict)
+            print(f"  ✓ PRS: {prs:.2f}/100")
+            yield PRSReady(prs, raw_scores, normalized_scores)
+            
+            # Step 5: Review (runs while the SWOT is generated and streamed)
+            print("[Step 5/6] Quality review...")
+            review_task = asyncio.create_task(self.reviewer_agent.review(raw_scores, evidence_map))
+            pending.append(review_task)
+            
+            # Step 6: SWOT (rule-based)
+            print("[Step 6/6] Generating SWOT (rule-based)...")
+            swot = self.swot_agent.generate_swot(normalized_scores)
+            print(f"  ✓ SWOT: {len(swot.strengths)} strengths, {len(swot.weaknesses)} weaknesses")
+            yield SWOTDone(swot)
+            
+            try:
+                confidence, flags = await review_task
+            except (TimeoutError, OutputValidationError) as e:
+                # The scores stand on their own; report the missing review instead of failing
+                print(f"  ⚠️  Quality review failed: {e!r}")
+                confidence, flags = "low", ["Quality review failed; scores were not reviewed"]
+                degraded = True
+            print(f"  ✓ Confidence: {confidence.upper()}")
+            
+            if flags:
+                print(f"  ⚠️  Quality flags: {len(flags)}")
+                if self.hooks:
+                    self.hooks.on_quality_check("reviewer", flags)
+            yield ReviewDone(confidence, flags)
+            
+            # Build final output with usage metrics
+            usage_summary = {}
             if self.hooks:
-                self.hooks.on_score_generated(
-                    dimension=dim,
-                    raw_score=score.raw_score,
-                    confidence=score.confidence,
-                    sources_count=len(score.sources),
-                )
-        
-        # Step 4: Scoring (deterministic)
-        print("[Step 4/6] Calculating PRS (deterministic)...")
-        prs, raw_scores, normalized_scores, evidence_map = self.scoring_agent.calculate_prs(
-            tech_momentum=tech_score,
-            market_gravity=market_score,
-            white_space=product_score,
-            strategic_leverage=strategic_score,
-            timing=timing_score,
-            regulatory_alignment=regulatory_score,
-        )
-        print(f"  ✓ PRS: {prs:.2f}/100")
-        
-        # Step 5: Review
-        print("[Step 5/6] Quality review...")
-        confidence, flags = await self.reviewer_agent.review(raw_scores, evidence_map)
-        print(f"  ✓ Confidence: {confidence.upper()}")
-
-        if flags:
-            print(f"  ⚠️  Quality flags: {len(flags)}")
+                hooks_summary = self.hooks.get_summary()
+                usage_summary = {
+                    "total_tokens": hooks_summary["total_tokens"],
+                    "estimated_cost": round(hooks_summary["estimated_cost"], 4),
+                    "duration_seconds": round(hooks_summary["total_duration_seconds"], 2),
+                    "agents_executed": hooks_summary["agents_executed"],
+                }
+            
+            output = PatentRelevanceOutput(
+                idea_id=invention.idea_id,
+                dimension_scores=raw_scores,
+                normalized_scores=normalized_scores,
+                patent_relevance_score=prs,
+                swot=swot,
+                confidence=confidence,
+                evidence_map=evidence_map,
+                flags=flags,
+                usage_summary=usage_summary,
+            )
+            
+            # Print execution summary
             if self.hooks:
-                self.hooks.on_quality_check("reviewer", flags)
-        
-        # Step 6: SWOT (rule-based)
-        print("[Step 6/6] Generating SWOT (rule-based)...")
-        swot = self.swot_agent.generate_swot(normalized_scores)
-        print(f"  ✓ SWOT: {len(swot.strengths)} strengths, {len(swot.weaknesses)} weaknesses")
-        
-        # Build final output with usage metrics
-        usage_summary = {}
-        if self.hooks:
-            hooks_summary = self.hooks.get_summary()
-            usage_summary = {
-                "total_tokens": hooks_summary["total_tokens"],
-                "estimated_cost": round(hooks_summary["estimated_cost"], 4),
-                "duration_seconds": round(hooks_summary["total_duration_seconds"], 2),
-                "agents_executed": hooks_summary["agents_executed"],
-            }
-        
-        output = PatentRelevanceOutput(
-            idea_id=invention.idea_id,
-            dimension_scores=raw_scores,
-            normalized_scores=normalized_scores,
-            patent_relevance_score=prs,
-            swot=swot,
-            confidence=confidence,
-            evidence_map=evidence_map,
-            flags=flags,
-            usage_summary=usage_summary,
-        )
-        
-        # Print execution summary
-        if self.hooks:
-            self.hooks.on_pipeline_complete()
-        
-        return output
+                self.hooks.on_pipeline_complete()
+            
+            yield Final(output, degraded)
+        finally:
+            self._discard_tasks(pending)
 
 
 async def main():
@@ -197,7 +383,10 @@ async def main():
     
     # Run pipeline with hooks enabled
     pipeline = PatentRelevancePipeline(enable_hooks=True)
-    result = await pipeline.evaluate(invention)
+    try:
+        result = await pipeline.evaluate(invention)
+    finally:
+        await pipeline.aclose()
     
     # Output as JSON
     print("=" * 80)
@@ -208,4 +397,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     asyncio.run(main())
@@ -1,29 +1,17 @@
 """Reviewer / Sanity Check Agent - Flags weak evidence and inconsistencies."""
-import json
-import os
-from typing import Dict, List, Literal
-from openai import OpenAI
+from typing import Dict, List, Literal, Optional, Tuple
+from openai import AsyncOpenAI
+from base_agent import call_llm_json, create_openai_client
+
+REVIEW_MAX_TOKENS = 200  # Confidence plus a short list of flags
+
+Review = Tuple[Literal["low", "medium", "high"], List[str]]
 
 
 class ReviewerAgent:
     """Reviews scores for quality and flags issues."""
     
-    def __init__(self):
-        self.name = "ReviewerAgent"
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    
-    async def review(
-        self,
-        raw_scores: Dict[str, float],
-        evidence_map: Dict[str, Dict],
-    ) -> tuple[Literal["low", "medium", "high"], List[str]]:
-        """Review scores and evidence."""
-        prompt = f"""Review this patent relevance assessment for quality issues.
-
-Raw Scores: {raw_scores}
-
-Evidence Map:
-{self._format_evidence(evidence_map)}
+    SYSTEM_PROMPT = """Review the patent relevance assessment given by the user for quality issues.
 
 Tasks:
 1. Flag weak evidence (vague sources, insufficient reasoning)
@@ -32,28 +20,92 @@ Tasks:
 4. Assign confidence level: "low", "medium", or "high"
 
 Return ONLY valid JSON (no markdown):
-{{
+{
     "confidence": "low" or "medium" or "high",
     "flags": ["flag1", "flag2", ...]
-}}
+}
 
 Be objective. Do NOT change scores."""
+    
+    # Rule-based review thresholds; only ambiguous cases go to the LLM
+    STRONG_MIN_SOURCES = 3
+    STRONG_MIN_CONFIDENCE = 0.8
+    STRONG_MAX_SCORE_RANGE = 2.5
+    WEAK_CONFIDENCE = 0.3
+    
+    def __init__(self, client: Optional[AsyncOpenAI] = None):
+        self.name = "ReviewerAgent"
+        self.client = client or create_openai_client()
+    
+    async def review(
+        self,
+        raw_scores: Dict[str, float],
+        evidence_map: Dict[str, Dict],
+    ) -> Review:
+        """Review scores and evidence."""
+        review = self._rule_based_review(raw_scores, evidence_map)
+        if review is not None:
+            return review
         
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            max_tokens=500,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        user_payload = f"""Raw Scores: {raw_scores}
+
+Evidence Map:
+{self._format_evidence(evidence_map)}"""
         
-        text = response.choices[0].message.content.strip()
-        if text.startswith("```"):
-            text = text.split("```")[1].lstrip("json\n")
-        if text.endswith("```"):
-            text = text[:-3]
-        result = json.loads(text)
+        result = await call_llm_json(
+            self.client,
+            self.name,
+            self.SYSTEM_PROMPT,
+            user_payload,
+            max_tokens=REVIEW_MAX_TOKENS,
+        )
         
         return result.get("confidence", "medium"), result.get("flags", [])
     
+    def _rule_based_review(
+        self,
+        raw_scores: Dict[str, float],
+        evidence_map: Dict[str, Dict],
+    ) -> Optional[Review]:
+        """
+        Review clear-cut cases without an LLM call.
+        
+        Returns "low" with generated flags if any dimension has no sources or
+        very low confidence, "high" if every dimension is well sourced,
+        confident and the scores are consistent, and None otherwise. Only
+        dimensions whose evidence reports a confidence are judged on it.
+        """
+        flags = []
+        min_sources = None
+        min_confidence = 1.0
+        for dim, evidence in evidence_map.items():
+            n_sources = len(evidence["sources"])
+            if not n_sources:
+                flags.append(f"{dim}: no supporting sources")
+            if min_sources is None or n_sources < min_sources:
+                min_sources = n_sources
+            
+            # Lenient signal agents don't ask for a confidence
+            confidence = evidence.get("confidence")
+            if confidence is None:
+                continue
+            if confidence <= self.WEAK_CONFIDENCE:
+                flags.append(f"{dim}: low confidence ({confidence:.2f})")
+            min_confidence = min(min_confidence, confidence)
+        
+        if flags:
+            return "low", flags
+        
+        if (
+            raw_scores
+            and min_sources >= self.STRONG_MIN_SOURCES
+            and min_confidence >= self.STRONG_MIN_CONFIDENCE
+            and max(raw_scores.values()) - min(raw_scores.values()) <= self.STRONG_MAX_SCORE_RANGE
+        ):
+            return "high", []
+        
+        return None
+    
     def _format_evidence(self, evidence_map: Dict[str, Dict]) -> str:
         """Format evidence for review."""
         lines = []
@@ -62,4 +114,6 @@ Be objective. Do NOT change scores."""
             lines.append(f"  Sources: {', '.join(evidence['sources'])}")
             lines.append(f"  Agent: {evidence['agent']}")
             lines.append(f"  Notes: {evidence['notes']}")
+            if "confidence" in evidence:
+                lines.append(f"  Confidence: {evidence['confidence']:.2f}")
         return "\n".join(lines)
@@ -1,6 +1,6 @@
 """Scoring Agent - Deterministic calculation of PRS (NO LLM)."""
-from typing import Dict
-from models import DimensionScore, SCORING_WEIGHTS
+from typing import Dict, Iterable, List, Sequence
+from models import DimensionScore, SCORING_DIMENSIONS, weighted_score, weighted_scores
 
 
 class ScoringAgent:
@@ -8,7 +8,6 @@ class ScoringAgent:
     
     def __init__(self):
         self.name = "ScoringAgent"
-        self.weights = SCORING_WEIGHTS
     
     def calculate_prs(
         self,
@@ -28,59 +27,45 @@ class ScoringAgent:
             - Normalized scores dict
             - Evidence map
         """
-        # Collect raw scores
-        raw_scores = {
-            "tech_momentum": tech_momentum.raw_score,
-            "market_gravity": market_gravity.raw_score,
-            "white_space": white_space.raw_score,
-            "strategic_leverage": strategic_leverage.raw_score,
-            "timing": timing.raw_score,
-            "regulatory_alignment": regulatory_alignment.raw_score,
-        }
+        scores = (
+            tech_momentum,
+            market_gravity,
+            white_space,
+            strategic_leverage,
+            timing,
+            regulatory_alignment,
+        )
         
-        # Normalize scores (0-100)
-        normalized_scores = {
-            key: (value / 5) * 100 for key, value in raw_scores.items()
-        }
+        # Collect raw, normalized (0-100) and evidence entries in one pass.
+        # Sources are copied: fallback and cached scores are shared across
+        # evaluations, so the output must not hold their lists.
+        raw_scores = {}
+        normalized_scores = {}
+        evidence_map = {}
+        for dimension, score in zip(SCORING_DIMENSIONS, scores):
+            raw = score.raw_score
+            raw_scores[dimension] = raw
+            normalized_scores[dimension] = (raw / 5) * 100
+            evidence = {
+                "sources": list(score.sources),
+                "agent": score.agent,
+                "notes": score.notes,
+            }
+            # Scores from agents that don't ask for a confidence only carry the default
+            if "confidence" in score.model_fields_set:
+                evidence["confidence"] = score.confidence
+            evidence_map[dimension] = evidence
         
         # Calculate weighted PRS
-        prs = sum(
-            normalized_scores[dimension] * weight
-            for dimension, weight in self.weights.items()
-        )
-        
-        # Build evidence map
-        evidence_map = {
-            "tech_momentum": {
-                "sources": tech_momentum.sources,
-                "agent": tech_momentum.agent,
-                "notes": tech_momentum.notes,
-            },
-            "market_gravity": {
-                "sources": market_gravity.sources,
-                "agent": market_gravity.agent,
-                "notes": market_gravity.notes,
-            },
-            "white_space": {
-                "sources": white_space.sources,
-                "agent": white_space.agent,
-                "notes": white_space.notes,
-            },
-            "strategic_leverage": {
-                "sources": strategic_leverage.sources,
-                "agent": strategic_leverage.agent,
-                "notes": strategic_leverage.notes,
-            },
-            "timing": {
-                "sources": timing.sources,
-                "agent": timing.agent,
-                "notes": timing.notes,
-            },
-            "regulatory_alignment": {
-                "sources": regulatory_alignment.sources,
-                "agent": regulatory_alignment.agent,
-                "notes": regulatory_alignment.notes,
-            },
-        }
+        prs = weighted_score(raw_scores)
         
         return prs, raw_scores, normalized_scores, evidence_map
+    
+    def calculate_prs_batch(self, raw_rows: Iterable[Sequence[float]]) -> List[float]:
+        """
+        Calculate PRS for many inventions at once.
+        
+        Each row holds raw 0-5 scores in SCORING_DIMENSIONS order; useful for
+        re-scoring a corpus without building DimensionScore objects.
+        """
+        return weighted_scores(raw_rows)
@@ -0,0 +1,147 @@
+"""Semantic response cache - reuses agent outputs for near-duplicate inventions."""
+import asyncio
+import math
+from collections import deque
+from threading import Lock
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from openai import AsyncOpenAI
+from base_agent import LLM_TIMEOUT_SECONDS, create_openai_client
+
+
+class BatchEmbedder:
+    """Collects embedding requests and sends them as batched API calls.
+    
+    ``submit`` queues a text and returns a future for its vector. Queued texts
+    are sent together on the next event-loop iteration (or on an explicit
+    ``flush``) in chunks of at most ``max_chunk`` inputs, so concurrent
+    evaluations sharing a cache pay one round trip instead of one per text.
+    """
+    
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        model: str = "text-embedding-3-small",
+        max_chunk: int = 200,
+    ):
+        self.client = client
+        self.model = model
+        self.max_chunk = max_chunk
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    def submit(self, text: str) -> asyncio.Future:
+        """Queue text for embedding and return a future for its vector."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        task = self._flush_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._flush_task = loop.create_task(self.flush())
+        return future
+    
+    async def flush(self) -> None:
+        """Embed every queued text, resolving each future with its vector or the error."""
+        # Texts submitted while this flush is waiting on the API get a flush of their own
+        self._flush_task = None
+        pending, self._pending = self._pending, []
+        try:
+            for start in range(0, len(pending), self.max_chunk):
+                chunk = [
+                    (text, future)
+                    for text, future in pending[start:start + self.max_chunk]
+                    if not future.done()
+                ]
+                if not chunk:
+                    continue
+                try:
+                    async with asyncio.timeout(LLM_TIMEOUT_SECONDS):
+                        response = await self.client.embeddings.create(
+                            model=self.model,
+                            input=[text for text, _ in chunk],
+                        )
+                except Exception as e:
+                    for _, future in chunk:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                
+                for (_, future), item in zip(chunk, sorted(response.data, key=lambda item: item.index)):
+                    if not future.done():
+                        future.set_result(item.embedding)
+        finally:
+            # A short response, an unexpected error or cancellation must not
+            # leave a caller awaiting its future forever
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(RuntimeError("No embedding returned for this input"))
+
+
+class SemanticCache:
+    """In-process cache of agent outputs keyed on text embeddings.
+    
+    Entries are grouped by namespace (one per agent) and matched by cosine
+    similarity against a threshold. Vectors are L2-normalized on insert, so
+    similarity is a plain dot product. Each namespace keeps at most
+    ``max_entries`` items and drops the oldest first.
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 1024,
+        model: str = "text-embedding-3-small",
+        client: Optional[AsyncOpenAI] = None,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model = model
+        self.client = client or create_openai_client()
+        self.embedder = BatchEmbedder(self.client, model)
+        self._entries: Dict[str, Deque[Tuple[List[float], Any]]] = {}
+        self._lock = Lock()
+    
+    async def embed(self, text: str) -> Optional[List[float]]:
+        """Return the normalized embedding for text, or None if it can't be computed."""
+        try:
+            vector = await self.embedder.submit(text)
+        except Exception as e:
+            print(f"  ⚠️  Semantic cache embedding failed: {e}")
+            return None
+        
+        norm = math.sqrt(math.sumprod(vector, vector))
+        if not norm:
+            return None
+        return [x / norm for x in vector]
+    
+    def get(self, namespace: str, vector: Optional[List[float]]) -> Optional[Any]:
+        """Return the closest cached value at or above the threshold, or None."""
+        if vector is None:
+            return None
+        
+        with self._lock:
+            entries = list(self._entries.get(namespace, ()))
+        
+        best_value = None
+        best_score = self.threshold
+        for cached_vector, value in entries:
+            score = math.sumprod(vector, cached_vector)
+            if score >= best_score:
+                best_score = score
+                best_value = value
+        return best_value
+    
+    def put(self, namespace: str, vector: Optional[List[float]], value: Any) -> None:
+        """Store a value under an embedding."""
+        if vector is None:
+            return
+        
+        with self._lock:
+            entries = self._entries.get(namespace)
+            if entries is None:
+                entries = self._entries[namespace] = deque(maxlen=self.max_entries)
+            entries.append((vector, value))
+    
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
@@ -1,299 +1,240 @@
 """Signal Agents - Technology, Market, Product Landscape, Regulatory, Strategic."""
 import json
-import os
-from openai import OpenAI
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from openai import AsyncOpenAI
+import pydantic
 from models import TriagedInvention, DimensionScore
-from base_agent import SignalAgent
-from validation import OutputValidator, ValidationError, sanitize_llm_output
-
-
-class TechnologySignalAgent(SignalAgent):
-    """Analyzes technology momentum using public indicators."""
+from base_agent import LLM_TIMEOUT_SECONDS, SIGNAL_MAX_TOKENS, SignalAgent, call_llm_json, create_openai_client
+from validation import OutputValidator, OutputValidationError
+
+
+@dataclass(frozen=True, slots=True)
+class SignalSpec:
+    """Everything that distinguishes one signal agent from another."""
+    name: str
+    dimension: str
+    subject: str  # What the prompt asks to assess, e.g. "technology momentum"
+    instruction: str  # Task-specific prompt lines
+    sources_example: Tuple[str, ...] = ("source1", "source2")
+    sources_default: Tuple[str, ...] = ("LLM analysis",)  # Used when the LLM omits sources
+    validated: bool = False  # Ask for confidence, validate, and fall back on failure
+    prefetchable: bool = False  # Reliable without triage keywords, so it may run during triage
     
-    def __init__(self):
-        super().__init__("TechnologySignalAgent")
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    
-    async def compute_signal(self, invention: TriagedInvention) -> DimensionScore:
-        """Compute technology momentum score with validation."""
-        prompt = f"""Assess technology momentum for:
-Concept: {invention.core_concept}
-Keywords: {', '.join(invention.technical_keywords)}
-Domains: {', '.join(invention.application_domains)}
-
-Based on general knowledge of public trends (Google Trends, GitHub, research velocity), 
-estimate a score 0-5 for technology momentum. Include your confidence level [0-1].
+    def system_prompt(self) -> str:
+        """Static system prompt for this signal."""
+        fields = [
+            '    "aggregate_score": <0-5 number>',
+            f'    "sources": {json.dumps(list(self.sources_example))}',
+        ]
+        if self.validated:
+            fields.append('    "notes": "brief explanation (min 10 chars)"')
+            fields.append('    "confidence": <0-1 float>')
+        else:
+            fields.append('    "notes": "brief explanation"')
+        schema = "{\n" + ",\n".join(fields) + "\n}"
+        return f"""Assess {self.subject} for the invention described by the user.
+
+{self.instruction}
 
 Return ONLY valid JSON (no markdown):
-{{
-    "aggregate_score": <0-5 number>,
-    "sources": ["source1", "source2", "source3"],
-    "notes": "brief explanation (min 10 chars)",
-    "confidence": <0-1 float>
-}}"""
+{schema}"""
+
+
+SIGNAL_SPECS: Tuple[SignalSpec, ...] = (
+    SignalSpec(
+        name="TechnologySignalAgent",
+        dimension="tech_momentum",
+        subject="technology momentum",
+        instruction=(
+            "Based on general knowledge of public trends (Google Trends, GitHub, research velocity), \n"
+            "estimate a score 0-5 for technology momentum. Include your confidence level [0-1]."
+        ),
+        sources_example=("source1", "source2", "source3"),
+        validated=True,
+    ),
+    SignalSpec(
+        name="MarketSignalAgent",
+        dimension="market_gravity",
+        subject="market gravity",
+        instruction=(
+            "Consider market size, growth trends, and capital exposure (from public knowledge).\n"
+            "Estimate a score 0-5 for market gravity. Include your confidence level [0-1]."
+        ),
+        sources_example=("source1", "source2", "source3"),
+        validated=True,
+    ),
+    SignalSpec(
+        name="ProductLandscapeAgent",
+        dimension="white_space",
+        subject="product landscape and white space",
+        instruction=(
+            "Estimate the white space (lack of competition). Score 0-5 where high = more white space.\n"
+            "Include commercial and open-source competitors."
+        ),
+        prefetchable=True,
+    ),
+    SignalSpec(
+        name="RegulatorySignalAgent",
+        dimension="regulatory_alignment",
+        subject="regulatory alignment",
+        instruction=(
+            "Consider regulatory friction, incentives, and geographic complexity.\n"
+            "High score = favorable regulatory environment. Score 0-5."
+        ),
+        prefetchable=True,
+    ),
+    SignalSpec(
+        name="StrategicLeverageAgent",
+        dimension="strategic_leverage",
+        subject="strategic leverage",
+        instruction=(
+            "Consider abstraction layer, reusability, and lock-in potential.\n"
+            "High score = more strategic value. Score 0-5."
+        ),
+        sources_example=("architectural reasoning",),
+        sources_default=("architectural reasoning",),
+        prefetchable=True,
+    ),
+    SignalSpec(
+        name="TimingAgent",
+        dimension="timing",
+        subject="market timing",
+        instruction=(
+            "Consider technology maturity, market readiness, and competitive timing.\n"
+            "High score = optimal timing. Score 0-5."
+        ),
+        prefetchable=True,
+    ),
+)
+
+
+class LLMSignalAgent(SignalAgent):
+    """Scores one signal dimension with an LLM, as described by a SignalSpec."""
+    
+    def __init__(self, spec: SignalSpec, client: Optional[AsyncOpenAI] = None):
+        super().__init__(spec.name)
+        self.spec = spec
+        self.dimension = spec.dimension
+        self.instruction = spec.instruction
+        self.SYSTEM_PROMPT = spec.system_prompt()
+        self.client = client or create_openai_client()
         
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                max_tokens=300,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            
-            raw_text = response.choices[0].message.content.strip()
-            clean_json = sanitize_llm_output(raw_text)
-            
-            # Validate and parse output
-            dimension_score = OutputValidator.validate_dimension_score(
-                clean_json,
-                agent_name=self.name,
-                min_confidence=0.3,
-            )
-            return dimension_score
-        except ValidationError as e:
-            # Fallback to safe default on validation failure
-            print(f"  ⚠️  {self.name} validation failed: {e}")
-            return DimensionScore(
-                raw_score=2.5,
-                normalized_score=50.0,
-                sources=["fallback_default"],
-                agent=self.name,
-                notes="Validation error occurred; using default score",
-                confidence=0.3,
-            )
-
-
-class MarketSignalAgent(SignalAgent):
-    """Analyzes market gravity using public indicators."""
+        # Built once and shared; callers treat scores as read-only
+        self._fallback = DimensionScore(
+            raw_score=2.5,
+            normalized_score=50.0,
+            sources=["fallback_default"],
+            agent=self.name,
+            notes="Validation error occurred; using default score",
+            confidence=0.3,
+        )
     
-    def __init__(self):
-        super().__init__("MarketSignalAgent")
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    def fallback_score(self) -> DimensionScore:
+        """Safe default used when the LLM output fails validation (always the same instance)."""
+        return self._fallback
     
     async def compute_signal(self, invention: TriagedInvention) -> DimensionScore:
-        """Compute market gravity score with validation."""
-        prompt = f"""Assess market gravity for:
-Concept: {invention.core_concept}
-Keywords: {', '.join(invention.technical_keywords)}
-Domains: {', '.join(invention.application_domains)}
-
-Consider market size, growth trends, and capital exposure (from public knowledge).
-Estimate a score 0-5 for market gravity. Include your confidence level [0-1].
-
-Return ONLY valid JSON (no markdown):
-{{
-    "aggregate_score": <0-5 number>,
-    "sources": ["source1", "source2", "source3"],
-    "notes": "brief explanation (min 10 chars)",
-    "confidence": <0-1 float>
-}}"""
+        """Compute this agent's dimension score."""
+        if not self.spec.validated:
+            try:
+                result = await self._call_llm_json(invention)
+                score = float(result.get("aggregate_score", 2.5))
+                return DimensionScore(
+                    raw_score=score,
+                    normalized_score=(score / 5) * 100,
+                    sources=result.get("sources", list(self.spec.sources_default)),
+                    agent=self.name,
+                    notes=result.get("notes", "")
+                )
+            except TimeoutError:
+                print(f"  ⚠️  {self.name} timed out after {LLM_TIMEOUT_SECONDS}s; using default score")
+                return self.fallback_score()
+            except (OutputValidationError, pydantic.ValidationError, TypeError, ValueError) as e:
+                # Invalid JSON, a non-numeric score or a model constraint (e.g. short notes)
+                print(f"  ⚠️  {self.name} validation failed: {e}")
+                return self.fallback_score()
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                max_tokens=300,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            result = await self._call_llm_json(invention)
             
-            raw_text = response.choices[0].message.content.strip()
-            clean_json = sanitize_llm_output(raw_text)
-            
-            dimension_score = OutputValidator.validate_dimension_score(
-                clean_json,
+            # Validate and parse output
+            return OutputValidator.validate_dimension_score(
+                result,
                 agent_name=self.name,
                 min_confidence=0.3,
             )
-            return dimension_score
-        except ValidationError as e:
+        except TimeoutError:
+            print(f"  ⚠️  {self.name} timed out after {LLM_TIMEOUT_SECONDS}s; using default score")
+            return self.fallback_score()
+        except OutputValidationError as e:
+            # Fallback to safe default on validation failure
             print(f"  ⚠️  {self.name} validation failed: {e}")
-            return DimensionScore(
-                raw_score=2.5,
-                normalized_score=50.0,
-                sources=["fallback_default"],
-                agent=self.name,
-                notes="Validation error occurred; using default score",
-                confidence=0.3,
-            )
-
-
-class ProductLandscapeAgent(SignalAgent):
-    """Analyzes product landscape and white space."""
-    
-    def __init__(self):
-        super().__init__("ProductLandscapeAgent")
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    
-    async def compute_signal(self, invention: TriagedInvention) -> DimensionScore:
-        """Compute white space score."""
-        prompt = f"""Assess product landscape and white space for:
-Concept: {invention.core_concept}
-Keywords: {', '.join(invention.technical_keywords)}
-Domains: {', '.join(invention.application_domains)}
-
-Estimate the white space (lack of competition). Score 0-5 where high = more white space.
-Include commercial and open-source competitors.
-
-Return ONLY valid JSON (no markdown):
-{{
-    "aggregate_score": <0-5 number>,
-    "sources": ["source1", "source2"],
-    "notes": "brief explanation"
-}}"""
-        
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            max_tokens=300,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        
-        text = response.choices[0].message.content.strip()
-        if text.startswith("```"):
-            text = text.split("```")[1].lstrip("json\n")
-        if text.endswith("```"):
-            text = text[:-3]
-        result = json.loads(text)
-        
-        return DimensionScore(
-            raw_score=float(result.get("aggregate_score", 2.5)),
-            normalized_score=(float(result.get("aggregate_score", 2.5)) / 5) * 100,
-            sources=result.get("sources", ["LLM analysis"]),
-            agent=self.name,
-            notes=result.get("notes", "")
-        )
+            return self.fallback_score()
 
 
-class RegulatorySignalAgent(SignalAgent):
-    """Analyzes regulatory alignment and friction."""
+class BatchedSignalAgent:
+    """Computes every signal dimension with a single LLM request.
     
-    def __init__(self):
-        super().__init__("RegulatorySignalAgent")
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    The six signal prompts share the same invention block, so asking for all
+    dimensions at once saves five round trips and most of the input tokens.
+    Each dimension is still validated on its own and falls back to a default
+    score independently.
+    """
     
-    async def compute_signal(self, invention: TriagedInvention) -> DimensionScore:
-        """Compute regulatory alignment score."""
-        prompt = f"""Assess regulatory alignment for:
-Concept: {invention.core_concept}
-Keywords: {', '.join(invention.technical_keywords)}
-Domains: {', '.join(invention.application_domains)}
-
-Consider regulatory friction, incentives, and geographic complexity.
-High score = favorable regulatory environment. Score 0-5.
-
-Return ONLY valid JSON (no markdown):
-{{
-    "aggregate_score": <0-5 number>,
-    "sources": ["source1", "source2"],
-    "notes": "brief explanation"
-}}"""
-        
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            max_tokens=300,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        
-        text = response.choices[0].message.content.strip()
-        if text.startswith("```"):
-            text = text.split("```")[1].lstrip("json\n")
-        if text.endswith("```"):
-            text = text[:-3]
-        result = json.loads(text)
-        
-        return DimensionScore(
-            raw_score=float(result.get("aggregate_score", 2.5)),
-            normalized_score=(float(result.get("aggregate_score", 2.5)) / 5) * 100,
-            sources=result.get("sources", ["LLM analysis"]),
-            agent=self.name,
-            notes=result.get("notes", "")
-        )
-
-
-class StrategicLeverageAgent(SignalAgent):
-    """Analyzes strategic leverage and reusability."""
-    
-    def __init__(self):
-        super().__init__("StrategicLeverageAgent")
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    def __init__(self, agents: List[SignalAgent], client: Optional[AsyncOpenAI] = None):
+        self.name = "BatchedSignalAgent"
+        self.agents = agents
+        self.client = client or create_openai_client()
+        self.system_prompt = self.build_system_prompt(agents)
     
-    async def compute_signal(self, invention: TriagedInvention) -> DimensionScore:
-        """Compute strategic leverage score."""
-        prompt = f"""Assess strategic leverage for:
-Concept: {invention.core_concept}
-Keywords: {', '.join(invention.technical_keywords)}
-Domains: {', '.join(invention.application_domains)}
-
-Consider abstraction layer, reusability, and lock-in potential.
-High score = more strategic value. Score 0-5.
-
-Return ONLY valid JSON (no markdown):
-{{
-    "aggregate_score": <0-5 number>,
-    "sources": ["architectural reasoning"],
-    "notes": "brief explanation"
-}}"""
-        
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            max_tokens=300,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        
-        text = response.choices[0].message.content.strip()
-        if text.startswith("```"):
-            text = text.split("```")[1].lstrip("json\n")
-        if text.endswith("```"):
-            text = text[:-3]
-        result = json.loads(text)
-        
-        return DimensionScore(
-            raw_score=float(result.get("aggregate_score", 2.5)),
-            normalized_score=(float(result.get("aggregate_score", 2.5)) / 5) * 100,
-            sources=result.get("sources", ["architectural reasoning"]),
-            agent=self.name,
-            notes=result.get("notes", "")
+    @staticmethod
+    def build_system_prompt(agents: List[SignalAgent]) -> str:
+        """Build the combined instructions covering every agent's dimension."""
+        tasks = "\n\n".join(
+            f"{agent.dimension}:\n{agent.instruction}" for agent in agents
         )
+        keys = ", ".join(agent.dimension for agent in agents)
+        return f"""Assess the following dimensions for the invention described by the user.
 
+{tasks}
 
-class TimingAgent(SignalAgent):
-    """Analyzes market timing and momentum."""
-    
-    def __init__(self):
-        super().__init__("TimingAgent")
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    
-    async def compute_signal(self, invention: TriagedInvention) -> DimensionScore:
-        """Compute timing score."""
-        prompt = f"""Assess market timing for:
-Concept: {invention.core_concept}
-Keywords: {', '.join(invention.technical_keywords)}
-Domains: {', '.join(invention.application_domains)}
-
-Consider technology maturity, market readiness, and competitive timing.
-High score = optimal timing. Score 0-5.
-
-Return ONLY valid JSON (no markdown):
+Return JSON with keys: {keys}, each an object {{aggregate_score, sources, notes, confidence}}:
 {{
     "aggregate_score": <0-5 number>,
     "sources": ["source1", "source2"],
-    "notes": "brief explanation"
+    "notes": "brief explanation (min 10 chars)",
+    "confidence": <0-1 float>
 }}"""
+    
+    async def compute_all(self, invention: TriagedInvention) -> Dict[str, DimensionScore]:
+        """Compute all dimension scores, keyed by dimension."""
+        try:
+            result = await call_llm_json(
+                self.client,
+                self.name,
+                self.system_prompt,
+                SignalAgent.invention_payload(invention),
+                max_tokens=SIGNAL_MAX_TOKENS * len(self.agents),
+            )
+        except TimeoutError:
+            # Every dimension falls back rather than failing the whole evaluation
+            print(f"  ⚠️  {self.name} timed out after {LLM_TIMEOUT_SECONDS}s; using default scores")
+            return {agent.dimension: agent.fallback_score() for agent in self.agents}
+        except OutputValidationError as e:
+            print(f"  ⚠️  {self.name} returned invalid JSON: {e}")
+            result = {}
         
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            max_tokens=300,
-            messages=[{"role": "user", "content": prompt}]
+        outcomes = OutputValidator.validate_dimension_scores(
+            [result.get(agent.dimension) or {} for agent in self.agents],
+            [agent.name for agent in self.agents],
+            min_confidence=0.3,
         )
         
-        text = response.choices[0].message.content.strip()
-        if text.startswith("```"):
-            text = text.split("```")[1].lstrip("json\n")
-        if text.endswith("```"):
-            text = text[:-3]
-        result = json.loads(text)
-        
-        return DimensionScore(
-            raw_score=float(result.get("aggregate_score", 2.5)),
-            normalized_score=(float(result.get("aggregate_score", 2.5)) / 5) * 100,
-            sources=result.get("sources", ["LLM analysis"]),
-            agent=self.name,
-            notes=result.get("notes", "")
-        )
+        scores = {}
+        for agent, outcome in zip(self.agents, outcomes):
+            if isinstance(outcome, OutputValidationError):
+                print(f"  ⚠️  {agent.name} validation failed: {outcome}")
+                outcome = agent.fallback_score()
+            scores[agent.dimension] = outcome
+        return scores
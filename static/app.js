@@ -149,8 +149,8 @@ ideaForm.addEventListener('submit', async (e) => {
         addMessage(`✅ Evaluation session started (ID: ${currentSessionId.substring(0, 8)}...)`, 'success');
         addMessage('⏳ Running signal agents in parallel...', 'info');
 
-        // Start polling for status
-        pollEvaluationStatus();
+        // Follow progress (streamed, with polling fallback)
+        streamEvaluationStatus();
 
     } catch (error) {
         addMessage(`❌ Error: ${error.message}`, 'error');
@@ -158,6 +158,79 @@ ideaForm.addEventListener('submit', async (e) => {
     }
 });
 
+function progressMessageType(msg) {
+    return msg.includes('✅') || msg.includes('success') ? 'success' :
+           msg.includes('❌') || msg.includes('error') ? 'error' :
+           msg.includes('⚠️') ? 'warning' : 'info';
+}
+
+function handleEvaluationFinished(status, error) {
+    if (status === 'completed') {
+        addMessage('✅ Evaluation completed successfully!', 'success');
+        
+        // Show tabbed section
+        tabbedSection.style.display = 'block';
+        
+        fetchAndDisplayResults();
+        submitBtn.disabled = false;
+    } else if (status === 'failed') {
+        addMessage(`❌ Evaluation failed: ${error}`, 'error');
+        submitBtn.disabled = false;
+    }
+}
+
+function streamEvaluationStatus() {
+    // Server-Sent Events push only new progress; fall back to polling if unavailable
+    if (!window.EventSource) {
+        pollEvaluationStatus();
+        return;
+    }
+
+    const source = new EventSource(`/api/stream/${currentSessionId}`);
+    let progressIndex = 0;
+    let finished = false;
+
+    const showProgress = (msg) => addMessage(msg, progressMessageType(msg), progressIndex++);
+    const showAgents = (agents, currentAgent) => {
+        if (agents && agents.length > 0) {
+            agentFlowData = agents;
+            updateAgentCards(agents, currentAgent);
+        }
+    };
+    const checkFinished = (status, error) => {
+        if (status === 'completed' || status === 'failed') {
+            finished = true;
+            source.close();
+            handleEvaluationFinished(status, error);
+        }
+    };
+
+    source.addEventListener('snapshot', (event) => {
+        const data = JSON.parse(event.data);
+        data.progress.forEach(showProgress);
+        showAgents(data.agents, data.current_agent);
+        checkFinished(data.status, data.error);
+    });
+    source.addEventListener('progress', (event) => {
+        showProgress(JSON.parse(event.data).message);
+    });
+    source.addEventListener('agents', (event) => {
+        // Only agents added since the previous event are sent
+        const data = JSON.parse(event.data);
+        showAgents(agentFlowData.concat(data.agents), data.current_agent);
+    });
+    source.addEventListener('status', (event) => {
+        const data = JSON.parse(event.data);
+        checkFinished(data.status, data.error);
+    });
+    source.onerror = () => {
+        if (finished) return;
+        console.error('Status stream error, falling back to polling');
+        source.close();
+        pollEvaluationStatus();
+    };
+}
+
 function pollEvaluationStatus() {
     statusCheckInterval = setInterval(async () => {
         try {
@@ -174,10 +247,7 @@ function pollEvaluationStatus() {
 
                 data.progress.forEach((msg, idx) => {
                     if (idx > lastDisplayedId) {
-                        const type = msg.includes('✅') || msg.includes('success') ? 'success' :
-                                    msg.includes('❌') || msg.includes('error') ? 'error' :
-                                    msg.includes('⚠️') ? 'warning' : 'info';
-                        addMessage(msg, type, idx);
+                        addMessage(msg, progressMessageType(msg), idx);
                     }
                 });
             }
@@ -189,19 +259,9 @@ function pollEvaluationStatus() {
             }
 
             // Check if evaluation is complete
-            if (data.status === 'completed') {
-                clearInterval(statusCheckInterval);
-                addMessage('✅ Evaluation completed successfully!', 'success');
-                
-                // Show tabbed section
-                tabbedSection.style.display = 'block';
-                
-                fetchAndDisplayResults();
-                submitBtn.disabled = false;
-            } else if (data.status === 'failed') {
+            if (data.status === 'completed' || data.status === 'failed') {
                 clearInterval(statusCheckInterval);
-                addMessage(`❌ Evaluation failed: ${data.error}`, 'error');
-                submitBtn.disabled = false;
+                handleEvaluationFinished(data.status, data.error);
             }
         } catch (error) {
             console.error('Status check error:', error);
@@ -1,11 +1,21 @@
 """SWOT Mapping Agent - Rule-based SWOT generation (NO LLM)."""
 from typing import Dict, List
-from models import SWOT
+from models import SCORING_DIMENSIONS, SWOT
 
 
 class SWOTAgent:
     """Pure rule-based SWOT mapping - NO LLM."""
     
+    STRENGTH_MIN = 70
+    WEAKNESS_MAX = 40
+    OPPORTUNITY_MIN = 65
+    THREAT_MAX = 40
+    
+    # Display names for the known dimensions, built once
+    _DISPLAY_NAMES: Dict[str, str] = {
+        dimension: dimension.replace("_", " ").title() for dimension in SCORING_DIMENSIONS
+    }
+    
     def __init__(self):
         self.name = "SWOTAgent"
     
@@ -24,32 +34,29 @@ class SWOTAgent:
         opportunities = []
         threats = []
         
-        # Strengths: >= 70
+        # Strengths (>= 70) and weaknesses (<= 40) in a single pass
         for dimension, score in normalized_scores.items():
-            if score >= 70:
+            if score >= self.STRENGTH_MIN:
                 strengths.append(f"{self._format_dimension(dimension)}: {score:.1f}/100")
-        
-        # Weaknesses: <= 40
-        for dimension, score in normalized_scores.items():
-            if score <= 40:
+            elif score <= self.WEAKNESS_MAX:
                 weaknesses.append(f"{self._format_dimension(dimension)}: {score:.1f}/100")
         
         # Opportunities: Market Gravity or Timing >= 65
-        if normalized_scores.get("market_gravity", 0) >= 65:
+        if normalized_scores.get("market_gravity", 0) >= self.OPPORTUNITY_MIN:
             opportunities.append(
                 f"Strong market potential ({normalized_scores['market_gravity']:.1f}/100)"
             )
-        if normalized_scores.get("timing", 0) >= 65:
+        if normalized_scores.get("timing", 0) >= self.OPPORTUNITY_MIN:
             opportunities.append(
                 f"Favorable timing ({normalized_scores['timing']:.1f}/100)"
             )
         
         # Threats: Regulatory Alignment <= 40 OR White Space <= 40
-        if normalized_scores.get("regulatory_alignment", 100) <= 40:
+        if normalized_scores.get("regulatory_alignment", 100) <= self.THREAT_MAX:
             threats.append(
                 f"Regulatory friction ({normalized_scores['regulatory_alignment']:.1f}/100)"
             )
-        if normalized_scores.get("white_space", 100) <= 40:
+        if normalized_scores.get("white_space", 100) <= self.THREAT_MAX:
             threats.append(
                 f"Crowded market ({normalized_scores['white_space']:.1f}/100)"
             )
@@ -63,4 +70,7 @@ class SWOTAgent:
     
     def _format_dimension(self, dimension: str) -> str:
         """Format dimension name for display."""
-        return dimension.replace("_", " ").title()
+        name = self._DISPLAY_NAMES.get(dimension)
+        if name is None:
+            name = dimension.replace("_", " ").title()
+        return name
@@ -0,0 +1,72 @@
+"""Tests for the ReviewerAgent rule-based shortcut."""
+import unittest
+from unittest import mock
+from models import DimensionScore, SCORING_DIMENSIONS
+from scoring_agent import ScoringAgent
+from reviewer_agent import ReviewerAgent
+from signal_agents import SIGNAL_SPECS, LLMSignalAgent
+
+SOURCES = ["Industry report", "Patent filings", "Academic survey"]
+
+
+def signal_scores(raw_score=4.0, confidence=0.9):
+    """Scores shaped like the default pipeline's: only validated agents report a confidence."""
+    scores = {}
+    for spec in SIGNAL_SPECS:
+        fields = dict(
+            raw_score=raw_score,
+            normalized_score=raw_score / 5 * 100,
+            sources=list(SOURCES),
+            agent=spec.name,
+            notes="Well supported by public evidence",
+        )
+        if spec.validated:
+            scores[spec.dimension] = DimensionScore(confidence=confidence, **fields)
+        else:
+            scores[spec.dimension] = DimensionScore(**fields)
+    return scores
+
+
+class ReviewerAgentTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.reviewer = ReviewerAgent(client=object())
+        patcher = mock.patch("reviewer_agent.call_llm_json", new_callable=mock.AsyncMock)
+        self.call_llm_json = patcher.start()
+        self.call_llm_json.return_value = {"confidence": "medium", "flags": ["checked by LLM"]}
+        self.addCleanup(patcher.stop)
+    
+    async def review(self, scores):
+        _, raw_scores, _, evidence_map = ScoringAgent().calculate_prs(**scores)
+        return await self.reviewer.review(raw_scores, evidence_map)
+    
+    async def test_clear_cut_evidence_skips_llm(self):
+        self.assertEqual(await self.review(signal_scores()), ("high", []))
+        self.call_llm_json.assert_not_awaited()
+    
+    async def test_fallback_score_skips_llm(self):
+        scores = signal_scores()
+        agent = LLMSignalAgent(SIGNAL_SPECS[0], client=object())
+        scores[agent.dimension] = agent.fallback_score()
+        
+        confidence, flags = await self.review(scores)
+        
+        self.assertEqual(confidence, "low")
+        self.assertEqual(flags, [f"{agent.dimension}: low confidence (0.30)"])
+        self.call_llm_json.assert_not_awaited()
+    
+    async def test_ambiguous_evidence_asks_llm(self):
+        self.assertEqual(
+            await self.review(signal_scores(confidence=0.6)),
+            ("medium", ["checked by LLM"]),
+        )
+        self.call_llm_json.assert_awaited_once()
+    
+    def test_unreported_confidence_is_left_out_of_evidence(self):
+        _, _, _, evidence_map = ScoringAgent().calculate_prs(**signal_scores())
+        reported = {dim for dim in SCORING_DIMENSIONS if "confidence" in evidence_map[dim]}
+        self.assertEqual(reported, {spec.dimension for spec in SIGNAL_SPECS if spec.validated})
+
+
+if __name__ == "__main__":
+    unittest.main()
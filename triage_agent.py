@@ -1,63 +1,58 @@
 """Triage Orchestrator Agent - Normalizes and triages patent ideas."""
-import json
 import os
-from openai import AzureOpenAI, OpenAI
+from typing import Optional
+from openai import AsyncOpenAI
+from base_agent import call_llm_json, create_openai_client
 from models import InventionInput, TriagedInvention
 
+TRIAGE_MAX_TOKENS = 250  # Concept summary plus keyword and domain lists
+
 
 class TriageOrchestrator:
     """Orchestrates input normalization and triage."""
     
-    def __init__(self):
+    SYSTEM_PROMPT = """You are a semantic extraction specialist.
+
+For the invention described by the user, extract and return ONLY valid JSON (no markdown, no explanations):
+{
+    "core_concept": "1-2 sentence summary of the core idea",
+    "technical_keywords": ["keyword1", "keyword2", ...],
+    "application_domains": ["domain1", "domain2", ...],
+    "analysis_depth": "triage or full"
+}"""
+    
+    def __init__(self, client: Optional[AsyncOpenAI] = None):
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY not set in environment")
-        # Try standard OpenAI client
+        # Use the shared client if given, else a standard OpenAI client
         try:
-            self.client = OpenAI(api_key=api_key)
+            self.client = client or create_openai_client()
         except Exception:
             self.client = None
         self.name = "TriageOrchestrator"
     
     async def triage(self, invention: InventionInput) -> TriagedInvention:
         """Triage and normalize the invention."""
-        prompt = f"""You are a semantic extraction specialist.
-
-Invention ID: {invention.idea_id}
+        user_payload = f"""Invention ID: {invention.idea_id}
 Title: {invention.title}
 Description: {invention.description}
 Technical Domain: {invention.technical_domain}
-Application Domains: {', '.join(invention.application_domains)}
-
-Extract and return ONLY valid JSON (no markdown, no explanations):
-{{
-    "core_concept": "1-2 sentence summary of the core idea",
-    "technical_keywords": ["keyword1", "keyword2", ...],
-    "application_domains": ["domain1", "domain2", ...],
-    "analysis_depth": "triage or full"
-}}"""
+Application Domains: {', '.join(invention.application_domains)}"""
         
         try:
-            # Try the standard completions API
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                max_tokens=500,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3
+            triage_data = await call_llm_json(
+                self.client,
+                self.name,
+                self.SYSTEM_PROMPT,
+                user_payload,
+                max_tokens=TRIAGE_MAX_TOKENS,
+                temperature=0.3,
             )
-            response_text = response.choices[0].message.content.strip()
         except Exception as e:
             print(f"API call failed: {e}")
             raise
         
-        # Parse JSON response
-        if response_text.startswith("```"):
-            response_text = response_text.split("```")[1].lstrip("json\n")
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
-        
-        triage_data = json.loads(response_text)
-        
         return TriagedInvention(
             idea_id=invention.idea_id,
             core_concept=triage_data.get("core_concept", ""),
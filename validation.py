@@ -1,11 +1,25 @@
 """Output validation and guardrails for signal agents."""
-import json
-from typing import Any, Dict, List
-from pydantic import ValidationError
-from models import DimensionScore
+import re
+from typing import Any, Dict, List, Sequence, Union
+import msgspec
+import pydantic
+from models import DimensionScore, DimensionScoreIn
 
+# Body of a leading ``` or ~~~ block (optionally tagged json), closed only by the
+# same fence; an unclosed block runs to the end
+_FENCED_BLOCK = re.compile(r"(```|~~~)(?:json)?\s*(.*?)\s*(?:\1|$)", re.DOTALL)
 
-class ValidationError(Exception):
+MIN_NOTES_LENGTH = 5  # Stripped characters of explanation a score needs
+LOW_AVERAGE_CONFIDENCE = 0.3  # Average confidence below this is flagged
+HIGH_SCORE_THRESHOLD = 95  # Normalized scores above this need solid confidence...
+HIGH_SCORE_MIN_CONFIDENCE = 0.6  # ...of at least this much
+
+# Built once; lax mode keeps accepting numbers sent as strings (e.g. "3.5")
+_score_decoder = msgspec.json.Decoder(DimensionScoreIn, strict=False)
+_score_list_decoder = msgspec.json.Decoder(List[DimensionScoreIn], strict=False)
+
+
+class OutputValidationError(Exception):
     """Raised when output validation fails."""
     pass
 
@@ -15,81 +29,159 @@ class OutputValidator:
     
     @staticmethod
     def validate_dimension_score(
-        raw_json: str,
+        raw_json: Union[str, bytes, Dict[str, Any]],
         agent_name: str,
         min_confidence: float = 0.3,
+        trust: bool = False,
     ) -> DimensionScore:
         """
         Validate and parse a dimension score from JSON.
         
         Args:
-            raw_json: Raw JSON string from LLM
+            raw_json: Raw JSON (str or bytes) from LLM, or an already-decoded dict
             agent_name: Name of the agent producing this score
             min_confidence: Minimum acceptable confidence [0-1]
+            trust: Output comes from a schema-enforced (structured output) call;
+                only the decoding and DimensionScore checks are applied, not
+                source stripping or the minimum confidence
             
         Returns:
             Validated DimensionScore object
             
         Raises:
-            ValidationError: If validation fails
+            OutputValidationError: If validation fails
         """
-        # Parse JSON
+        # Parse JSON and check field types, sources and ranges in one pass
         try:
-            if isinstance(raw_json, str):
-                data = json.loads(raw_json)
+            if isinstance(raw_json, (str, bytes)):
+                data = _score_decoder.decode(raw_json)
             else:
-                data = raw_json
-        except json.JSONDecodeError as e:
-            raise ValidationError(f"Invalid JSON from {agent_name}: {e}")
+                data = msgspec.convert(raw_json, DimensionScoreIn, strict=False)
+        except msgspec.ValidationError as e:
+            raise OutputValidationError(f"{agent_name}: Invalid score output: {e}")
+        except msgspec.DecodeError as e:
+            raise OutputValidationError(f"Invalid JSON from {agent_name}: {e}")
+        
+        if trust:
+            score = data.aggregate_score
+            try:
+                return DimensionScore(
+                    raw_score=score,
+                    normalized_score=(score / 5) * 100,
+                    sources=data.sources,
+                    agent=agent_name,
+                    notes=data.notes,
+                    confidence=data.confidence,
+                )
+            except pydantic.ValidationError as e:
+                raise OutputValidationError(f"{agent_name}: Invalid score output: {e}")
+        
+        return OutputValidator._score_from_input(data, agent_name, min_confidence)
+    
+    @staticmethod
+    def validate_dimension_scores(
+        raw_items: Sequence[Union[str, bytes, Dict[str, Any]]],
+        agent_names: Sequence[str],
+        min_confidence: float = 0.3,
+    ) -> List[Union[DimensionScore, OutputValidationError]]:
+        """
+        Validate several dimension scores, decoding them all in one msgspec call.
         
-        # Extract and validate score
+        Args:
+            raw_items: Raw JSON (str or bytes) or decoded dicts, one per agent
+            agent_names: Name of the agent behind each item
+            min_confidence: Minimum acceptable confidence [0-1]
+            
+        Returns:
+            A DimensionScore or the OutputValidationError for each item, in order
+        
+        Raises:
+            ValueError: If raw_items and agent_names differ in length
+        """
+        if len(raw_items) != len(agent_names):
+            raise ValueError(
+                f"Got {len(raw_items)} items for {len(agent_names)} agents"
+            )
+        
+        # One decode for the whole batch; if anything fails, redo it per item so
+        # each error is reported against the right agent
         try:
-            score = float(data.get("aggregate_score", 0))
-            if not (0 <= score <= 5):
-                raise ValidationError(
-                    f"{agent_name}: Score {score} out of range [0-5]"
+            if all(isinstance(item, (str, bytes)) for item in raw_items):
+                batch = _score_list_decoder.decode(
+                    b"[" + b",".join(
+                        item.encode() if isinstance(item, str) else item for item in raw_items
+                    ) + b"]"
                 )
-        except (ValueError, TypeError) as e:
-            raise ValidationError(f"{agent_name}: Invalid score value: {e}")
+            else:
+                batch = msgspec.convert(raw_items, List[DimensionScoreIn], strict=False)
+        except msgspec.DecodeError:
+            batch = None
         
-        # Extract sources
-        sources = data.get("sources", [])
-        if not isinstance(sources, list) or len(sources) == 0:
-            raise ValidationError(f"{agent_name}: No sources provided")
+        # An item holding several comma-separated objects decodes fine inside the
+        # joined array but shifts every later item; validate those one by one
+        if batch is not None and len(batch) != len(raw_items):
+            batch = None
         
-        sources = [s.strip() for s in sources if isinstance(s, str) and s.strip()]
+        results = []
+        for index, agent_name in enumerate(agent_names):
+            try:
+                if batch is None:
+                    score = OutputValidator.validate_dimension_score(
+                        raw_items[index], agent_name, min_confidence
+                    )
+                else:
+                    score = OutputValidator._score_from_input(batch[index], agent_name, min_confidence)
+            except OutputValidationError as e:
+                score = e
+            results.append(score)
+        return results
+    
+    @staticmethod
+    def _score_from_input(
+        data: DimensionScoreIn,
+        agent_name: str,
+        min_confidence: float,
+    ) -> DimensionScore:
+        """Apply the checks msgspec can't express and build the DimensionScore."""
+        score = data.aggregate_score
+        
+        # Strip each source once, dropping blanks; JSON values without strip()
+        # (numbers, null, lists, objects) are skipped
+        sources = []
+        for source in data.sources:
+            try:
+                source = source.strip()
+            except AttributeError:
+                continue
+            if source:
+                sources.append(source)
         if not sources:
-            raise ValidationError(f"{agent_name}: All sources are empty strings")
+            raise OutputValidationError(f"{agent_name}: All sources are empty strings")
         
-        # Extract notes
-        notes = data.get("notes", "")
-        if not isinstance(notes, str) or len(notes.strip()) < 5:
-            raise ValidationError(
-                f"{agent_name}: Notes too brief or missing (min 5 chars)"
+        # Check notes
+        notes = data.notes.strip()
+        if len(notes) < MIN_NOTES_LENGTH:
+            raise OutputValidationError(
+                f"{agent_name}: Notes too brief or missing (min {MIN_NOTES_LENGTH} chars)"
             )
         
-        # Extract confidence if provided
-        confidence = float(data.get("confidence", 0.5))
+        # Confidence range was checked while decoding; the minimum is per call
+        confidence = data.confidence
         if confidence < min_confidence:
-            raise ValidationError(
+            raise OutputValidationError(
                 f"{agent_name}: Confidence {confidence:.2f} below minimum {min_confidence}"
             )
         
-        # Build validated DimensionScore
-        try:
-            dimension_score = DimensionScore(
-                raw_score=score,
-                normalized_score=(score / 5) * 100,
-                sources=sources,
-                agent=agent_name,
-                notes=notes.strip(),
-                confidence=confidence,
-            )
-            return dimension_score
-        except Exception as e:
-            raise ValidationError(
-                f"{agent_name}: Failed to create DimensionScore: {e}"
-            )
+        # Validated construction is cheaper than model_construct and re-checks
+        # the model's own constraints; every field passed the checks above
+        return DimensionScore(
+            raw_score=score,
+            normalized_score=(score / 5) * 100,
+            sources=sources,
+            agent=agent_name,
+            notes=notes,
+            confidence=confidence,
+        )
     
     @staticmethod
     def validate_multiple_scores(
@@ -106,25 +198,32 @@ class OutputValidator:
         Returns:
             (is_valid, list_of_issues)
         """
+        # One pass over the scores; sum() keeps its compensated float total
+        confidences = []
+        score_issues = []
+        for score in scores:
+            confidence = score.confidence
+            confidences.append(confidence)
+            if score.normalized_score > HIGH_SCORE_THRESHOLD and confidence < HIGH_SCORE_MIN_CONFIDENCE:
+                score_issues.append(
+                    f"{score.agent}: High score {score.normalized_score:.1f} with low confidence {confidence:.2f}"
+                )
+        
+        count = len(confidences)
         issues = []
         
-        if len(scores) < required_dimensions:
+        if count < required_dimensions:
             issues.append(
-                f"Only {len(scores)} dimensions provided, expected {required_dimensions}"
+                f"Only {count} dimensions provided, expected {required_dimensions}"
             )
         
-        avg_confidence = sum(s.confidence for s in scores) / len(scores) if scores else 0
-        if avg_confidence < 0.3:
+        avg_confidence = sum(confidences) / count if count else 0
+        if avg_confidence < LOW_AVERAGE_CONFIDENCE:
             issues.append(
-                f"Average confidence {avg_confidence:.2f} is very low (< 0.3)"
+                f"Average confidence {avg_confidence:.2f} is very low (< {LOW_AVERAGE_CONFIDENCE})"
             )
         
-        for score in scores:
-            if score.normalized_score > 95 and score.confidence < 0.6:
-                issues.append(
-                    f"{score.agent}: High score {score.normalized_score:.1f} with low confidence {score.confidence:.2f}"
-                )
-        
+        issues.extend(score_issues)
         return (len(issues) == 0, issues)
 
 
@@ -141,11 +240,6 @@ def sanitize_llm_output(raw_text: str) -> str:
     text = raw_text.strip()
     
     # Remove markdown code blocks
-    if text.startswith("```"):
-        text = text.split("```")[1]
-        if text.startswith("json"):
-            text = text[4:]
-    if text.endswith("```"):
-        text = text[:-3]
-    
-    return text.strip()
+    if text.startswith(("```", "~~~")):
+        return _FENCED_BLOCK.match(text).group(2)
+    return text.removesuffix("```").rstrip()
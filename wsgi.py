@@ -0,0 +1,12 @@
+"""WSGI entry point for serving the web interface with a production server.
+
+Sessions live in process memory, so run a single worker and scale with threads:
+
+    gunicorn -k gthread --workers 1 --threads 8 --bind 0.0.0.0:5000 wsgi:app
+
+Open progress streams each hold a thread and are capped at app.MAX_SSE_STREAMS,
+so keep --threads above that cap.
+"""
+from app import app
+
+__all__ = ["app"]